@@ -2,20 +2,34 @@
 
 # imports
 import copy
+import functools
+import hashlib
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+import time
 from collections import defaultdict
 from contextlib import asynccontextmanager
-from typing import Any, Dict
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
 # packages
+import jinja2
+import orjson
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.routing import Route
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
 from folio import FOLIO
 from alea_llm_client import (
     AnthropicModel,
@@ -34,10 +48,76 @@ import folio_api.routes.properties
 import folio_api.routes.explore
 import folio_api.routes.connections
 from folio_api.api_config import load_config
+from folio_api.asgi_health import FastPathInterceptor
+from folio_api.ontology_cache import load_or_build, snapshot_key
 from folio_api.rate_limit import RateLimitConfig, RateLimitMiddleware
+from folio_api.representation_cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_SIZE,
+    RepresentationCache,
+)
+from folio_api.serialization import ClassJSONCache
+
+# Routers in registration order, resolved once at import so repeated get_app()
+# calls only include them. root.router has the /{iri} catch-all, so it must be
+# registered last.
+_ROUTERS = (
+    folio_api.routes.info.router,
+    folio_api.routes.search.router,
+    folio_api.routes.taxonomy.router,
+    folio_api.routes.properties.router,
+    folio_api.routes.explore.router,
+    folio_api.routes.connections.router,
+    folio_api.routes.root.router,
+)
+
+_STATIC_DIR = Path(__file__).parent / "static"
+_TEMPLATES_DIR = Path(__file__).parent / "templates" / "jinja2"
 
 _DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# DELETE ends Streamable HTTP sessions on the /mcp app.
+_DEFAULT_CORS_METHODS = ["GET", "HEAD", "OPTIONS", "POST", "DELETE"]
+
+# Accept/Content-Type are CORS-safelisted and always allowed by Starlette.
+_DEFAULT_CORS_HEADERS = ["mcp-session-id", "mcp-protocol-version", "last-event-id"]
+
+_LOG_LEVELS = {
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders ``asctime`` from a per-second cached string.
+
+    ``logging.Formatter.formatTime`` calls ``time.strftime`` for every record;
+    here the ``%Y-%m-%d %H:%M:%S`` part is reformatted at most once per second
+    and only the milliseconds are appended per record, so output is identical
+    to the default format.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_second = -1
+        self._cached_prefix = ""
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime(
+                self.default_time_format, self.converter(second)
+            )
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_prefix, record.msecs)
+
 
 class CachedStaticFiles(StaticFiles):
     """StaticFiles that sets an explicit ``Cache-Control`` header.
@@ -48,16 +128,97 @@ class CachedStaticFiles(StaticFiles):
     broke the Entity Graph for returning visitors: new HTML, but a cached old
     ``unified_tree.js`` with no graph wiring). Paired with ``?v=`` cache-busting
     on asset URLs, a deploy now changes the URL and browsers revalidate.
+
+    The ``ETag`` is the Apache-style ``"<mtime_ns>-<size>"`` pair taken straight
+    from the ``stat()`` result Starlette already performed, so revalidation
+    (``If-None-Match`` / ``If-Modified-Since``) answers ``304`` without hashing.
     """
 
-    def file_response(self, *args: Any, **kwargs: Any):
-        response = super().file_response(*args, **kwargs)
-        response.headers.setdefault(
-            "Cache-Control", "public, max-age=3600, must-revalidate"
+    cache_control = "public, max-age=3600, must-revalidate"
+
+    def file_response(
+        self,
+        full_path: Any,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            headers={
+                "etag": f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"',
+                "cache-control": self.cache_control,
+            },
         )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
         return response
 
 
+async def _openapi_json(request: Request) -> Response:
+    """Serve the OpenAPI schema from bytes encoded once per process.
+
+    Behind a path-prefix proxy the ASGI ``root_path`` is listed first in
+    ``servers``, as FastAPI's own route does, so Swagger UI calls the API
+    through the prefix. Those bodies are encoded once per ``root_path``.
+    """
+    app_instance = request.app
+    root_path = request.scope.get("root_path", "").rstrip("/")
+    if not root_path or not app_instance.root_path_in_servers:
+        openapi_bytes = getattr(app_instance.state, "openapi_bytes", None)
+        if openapi_bytes is None:
+            openapi_bytes = orjson.dumps(app_instance.openapi())
+            app_instance.state.openapi_bytes = openapi_bytes
+        return Response(content=openapi_bytes, media_type="application/json")
+
+    bodies = getattr(app_instance.state, "openapi_bytes_by_root_path", None)
+    if bodies is None:
+        bodies = app_instance.state.openapi_bytes_by_root_path = {}
+    openapi_bytes = bodies.get(root_path)
+    if openapi_bytes is None:
+        schema = dict(app_instance.openapi())
+        servers = [
+            server
+            for server in schema.get("servers", ())
+            if server.get("url") != root_path
+        ]
+        schema["servers"] = [{"url": root_path}, *servers]
+        openapi_bytes = bodies[root_path] = orjson.dumps(schema)
+    return Response(content=openapi_bytes, media_type="application/json")
+
+
+def _serve_prebuilt_openapi(app_instance: FastAPI) -> None:
+    """Swap FastAPI's ``/openapi.json`` route for one serving pre-encoded bytes.
+
+    FastAPI caches the schema dict but re-encodes it with ``json.dumps`` on
+    every request. The replacement keeps the route's position, so it still
+    precedes the ``/{iri}`` catch-all.
+    """
+    for index, route in enumerate(app_instance.router.routes):
+        if getattr(route, "path", None) == app_instance.openapi_url:
+            app_instance.router.routes[index] = Route(
+                app_instance.openapi_url, _openapi_json, include_in_schema=False
+            )
+            return
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dirs(static_dir: Path, templates_dir: Path) -> Tuple[Path, Path]:
+    """Create the static/templates directories if missing, once per process.
+
+    ``mkdir(exist_ok=True)`` is a single syscall either way, and the cache means
+    repeated ``get_app()`` calls (tests, reloads) don't repeat it.
+    """
+    for directory in (static_dir, templates_dir):
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            raise RuntimeError("Failed to create directory: %s" % directory) from e
+    return static_dir, templates_dir
+
+
 def _compute_asset_version(directory: Path) -> str:
     """Cache-busting token = newest static-asset mtime (integer seconds).
 
@@ -75,6 +236,31 @@ def _compute_asset_version(directory: Path) -> str:
         return "0"
 
 
+@functools.lru_cache(maxsize=None)
+def _compute_render_version(templates_dir: Path, package_dir: Path) -> str:
+    """Digest of the templates and Python sources that render representations.
+
+    Hashes every template file and every module of the package by path and
+    content, so a deploy that edits a template or rendering code changes it
+    even if the package version does not.
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    files = sorted(
+        [
+            *(path for path in templates_dir.rglob("*") if path.is_file()),
+            *package_dir.rglob("*.py"),
+        ]
+    )
+    for path in files:
+        if "__pycache__" in path.parts:
+            continue
+        digest.update(str(path.relative_to(package_dir.parent)).encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(path.read_bytes())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
 @asynccontextmanager
 async def lifespan_handler(app_instance: FastAPI):
     """Context manager to handle the lifespan events of the FastAPI app
@@ -85,66 +271,155 @@ async def lifespan_handler(app_instance: FastAPI):
     Yields:
         None
     """
-    # Initialize the FOLIO graph
-    app_instance.state.config = load_config()
+    # Reuse the configuration loaded by get_app(); fall back for bare apps.
+    if not hasattr(app_instance.state, "config"):
+        app_instance.state.config = load_config()
     app_instance.state.logger = logging.getLogger("folio_api")
 
     # Configure logging via dictConfig if provided, otherwise fall back to
     # simple FileHandler setup using the log_level key.
     api_config = app_instance.state.config["api"]
     logging_config = api_config.get("logging")
+    log_listener = None
+    queue_handler = None
     if logging_config and "version" in logging_config:
         logging_config = copy.deepcopy(logging_config)
         if "formatters" not in logging_config:
-            logging_config["formatters"] = {"default": {"format": _DEFAULT_LOG_FORMAT}}
+            logging_config["formatters"] = {
+                "default": {
+                    "()": CachedTimeFormatter,
+                    "format": _DEFAULT_LOG_FORMAT,
+                }
+            }
             for handler in logging_config.get("handlers", {}).values():
                 handler.setdefault("formatter", "default")
         logging.config.dictConfig(logging_config)
     else:
-        log_level = {
-            "info": logging.INFO,
-            "debug": logging.DEBUG,
-            "warning": logging.WARNING,
-            "error": logging.ERROR,
-            "critical": logging.CRITICAL,
-        }.get(api_config.get("log_level", "info").lower().strip(), logging.INFO)
+        log_level = _LOG_LEVELS.get(
+            api_config.get("log_level", "info").lower().strip(), logging.INFO
+        )
 
         app_instance.state.logger.setLevel(log_level)
         log_handler = logging.FileHandler("api.log")
         log_handler.setLevel(log_level)
-        log_formatter = logging.Formatter(_DEFAULT_LOG_FORMAT)
+        log_formatter = CachedTimeFormatter(_DEFAULT_LOG_FORMAT)
         log_handler.setFormatter(log_formatter)
-        app_instance.state.logger.addHandler(log_handler)
 
-    # initialize the FOLIO instance
-    app_instance.state.folio = initialize_folio(
-        app_instance.state.config["folio"],
-        app_instance.state.config["llm"],
-    )
+        # Request handlers only enqueue records; a background listener thread
+        # does the blocking file write off the event loop.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        log_listener = logging.handlers.QueueListener(
+            log_queue, log_handler, respect_handler_level=True
+        )
+        log_listener.start()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        app_instance.state.logger.addHandler(queue_handler)
 
-    # Build reverse index for property children lookups
-    property_children = defaultdict(list)
-    for prop in app_instance.state.folio.object_properties:
-        for parent_iri in prop.sub_property_of:
-            property_children[parent_iri].append(prop)
-    app_instance.state.property_children = dict(property_children)
+    try:
+        # initialize the FOLIO instance
+        app_instance.state.folio = initialize_folio(
+            app_instance.state.config["folio"],
+            app_instance.state.config["llm"],
+        )
 
-    # Share FOLIO instance with MCP server
-    from folio_mcp.server import set_shared_folio
+        # Build reverse index for property children lookups
+        property_children = defaultdict(list)
+        for prop in app_instance.state.folio.object_properties:
+            for parent_iri in prop.sub_property_of:
+                property_children[parent_iri].append(prop)
+        app_instance.state.property_children = dict(property_children)
+
+        # Serialize every class/property to JSON once; list and search routes
+        # assemble their bodies from these cached fragments.
+        app_instance.state.class_json = ClassJSONCache(
+            exclude_none=api_config.get("exclude_none", False)
+        )
+        app_instance.state.class_json.warm(app_instance.state.folio.classes)
+        app_instance.state.class_json.warm(app_instance.state.folio.object_properties)
 
-    set_shared_folio(app_instance.state.folio)
+        # Rendered Markdown/JSON-LD/XML/HTML bodies, filled on first request
+        # unless api.warm_representations asks for everything up front.
+        app_instance.state.representations = RepresentationCache(
+            api_config.get("representation_cache_size", DEFAULT_MAX_SIZE)
+        )
+        if api_config.get("warm_representations", False):
+            folio_api.routes.root.warm_representations(
+                app_instance.state.representations,
+                app_instance.state.folio,
+                workers=api_config.get("warm_workers", 0),
+            )
 
-    # log it
-    llm = app_instance.state.folio.llm
-    app_instance.state.logger.info(
-        "FOLIO instance initialized with llm %s",
-        llm.model if llm is not None else "<disabled>",
-    )
+        # Encoded /search/prefix, /search/label, /search/definition and LLM
+        # search bodies, keyed by route and query and bounded by total size.
+        app_instance.state.search_responses = RepresentationCache(
+            api_config.get("search_cache_size", DEFAULT_MAX_SIZE),
+            max_bytes=api_config.get("search_cache_bytes", DEFAULT_MAX_BYTES),
+        )
+        folio_api.routes.search.warm_search_indexes(app_instance.state.folio)
+        warm_depths = api_config.get("warm_search_sets", False)
+        if warm_depths:
+            # true warms the default depth; a list names the depths to warm
+            if warm_depths is True:
+                folio_api.routes.search.warm_search_sets(app_instance.state.folio)
+            else:
+                folio_api.routes.search.warm_search_sets(
+                    app_instance.state.folio, depths=warm_depths
+                )
+
+        # Share FOLIO instance with MCP server
+        from folio_mcp.server import set_shared_folio
+
+        set_shared_folio(app_instance.state.folio)
+
+        # Validator shared by every /{iri} representation and search body. It is
+        # keyed on the serialized content of every class and property, so any
+        # ontology edit changes it, as do folio-python, the folio-api package
+        # version, the templates and rendering code, the API version and a
+        # static-asset deploy.
+        try:
+            package_version = version("folio-api")
+        except PackageNotFoundError:
+            package_version = "unknown"
+        app_instance.state.entity_etag = 'W/"%s"' % snapshot_key(
+            {
+                "content": app_instance.state.class_json.content_digest(),
+                "exclude_none": api_config.get("exclude_none"),
+                "api_version": api_config.get("version"),
+                "package_version": package_version,
+                "render_version": _compute_render_version(
+                    _TEMPLATES_DIR, Path(__file__).parent
+                ),
+                "asset_version": getattr(app_instance.state, "asset_version", None),
+            }
+        )
+
+        # The health payload is static for the life of the process.
+        app_instance.state.health_bytes = folio_api.routes.info.health_json(
+            app_instance.state.folio
+        )
 
-    yield
+        # Build and encode the OpenAPI schema now rather than on the first request.
+        app_instance.state.openapi_bytes = orjson.dumps(app_instance.openapi())
 
-    # log shutdown
-    app_instance.state.logger.info("Shutting down API")
+        # log it
+        llm = app_instance.state.folio.llm
+        app_instance.state.logger.info(
+            "FOLIO instance initialized with llm %s",
+            llm.model if llm is not None else "<disabled>",
+        )
+
+        yield
+
+        # log shutdown
+        app_instance.state.logger.info("Shutting down API")
+    finally:
+        # flush any queued records to disk, then detach this app's handlers
+        # from the shared "folio_api" logger so later apps do not feed a dead
+        # queue; also runs when startup fails
+        if log_listener is not None:
+            app_instance.state.logger.removeHandler(queue_handler)
+            log_listener.stop()
+            log_handler.close()
 
 
 _LLM_CLASSES = {
@@ -170,7 +445,8 @@ def initialize_folio(folio_config: Dict[str, Any], llm_config: Dict[str, Any]) -
     """Initialize FOLIO instance based on configuration.
 
     Args:
-        folio_config: FOLIO configuration dictionary
+        folio_config: FOLIO configuration dictionary. ``snapshot_cache``
+            (default true) reuses a shared pickled snapshot of the parsed graph.
         llm_config: LLM configuration dictionary. Supports keys:
             - type: Provider name ("openai", "anthropic", "google", "grok", "vllm")
             - model: Model name (default: "gpt-5.1-mini")
@@ -185,17 +461,16 @@ def initialize_folio(folio_config: Dict[str, Any], llm_config: Dict[str, Any]) -
     llm_engine = llm_config.get("type", "openai").lower().strip()
     llm_model = llm_config.get("model", "gpt-5.1-mini").strip()
     llm_endpoint = llm_config.get("endpoint", None)
-    llm_api_key = llm_config.get(
-        "api_key", os.getenv(_API_KEY_ENV_VARS.get(llm_engine, "OPENAI_API_KEY"))
-    )
+    api_key_env_var = _API_KEY_ENV_VARS.get(llm_engine, "OPENAI_API_KEY")
+    llm_api_key = llm_config.get("api_key")
     # Treat un-substituted "${ENV_VAR}" placeholders as missing so the literal
     # string isn't passed to the LLM client as a key. Falls back to env var.
-    if (
+    if llm_api_key is None or (
         isinstance(llm_api_key, str)
         and llm_api_key.startswith("${")
         and llm_api_key.endswith("}")
     ):
-        llm_api_key = os.getenv(_API_KEY_ENV_VARS.get(llm_engine, "OPENAI_API_KEY"))
+        llm_api_key = os.getenv(api_key_env_var)
     llm_effort = llm_config.get("effort", None)
     llm_tier = llm_config.get("tier", None)
 
@@ -219,20 +494,41 @@ def initialize_folio(folio_config: Dict[str, Any], llm_config: Dict[str, Any]) -
                 "/search and other LLM-backed routes will return errors. "
                 "Set %s env var or config.llm.api_key to enable.",
                 llm_engine,
-                _API_KEY_ENV_VARS.get(llm_engine, "OPENAI_API_KEY"),
+                api_key_env_var,
             )
         llm = None
 
-    return FOLIO(
-        source_type=folio_config["source"],
-        github_repo_owner=folio_config["repository"].split("/")[0],
-        github_repo_name=folio_config["repository"].split("/")[1],
-        github_repo_branch=folio_config["branch"],
-        use_cache=True,
-        llm=llm,
-        effort=llm_effort,
-        tier=llm_tier,
+    repo_owner, _, repo_name = folio_config["repository"].partition("/")
+
+    def build_folio() -> FOLIO:
+        return FOLIO(
+            source_type=folio_config["source"],
+            github_repo_owner=repo_owner,
+            github_repo_name=repo_name,
+            github_repo_branch=folio_config["branch"],
+            use_cache=True,
+            llm=llm,
+            effort=llm_effort,
+            tier=llm_tier,
+        )
+
+    if not folio_config.get("snapshot_cache", True):
+        return build_folio()
+
+    # Reuse the parsed graph from a shared pickle snapshot when another worker
+    # (or a previous boot) already built it; see folio_api/ontology_cache.py.
+    folio = load_or_build(
+        build_folio,
+        key_parts={
+            "folio": folio_config,
+            "llm_engine": llm_engine,
+            "effort": llm_effort,
+            "tier": llm_tier,
+        },
     )
+    if folio.llm is None:
+        folio.llm = llm
+    return folio
 
 
 def get_app() -> FastAPI:
@@ -281,6 +577,21 @@ def get_app() -> FastAPI:
         },
         lifespan=lifespan_handler,
     )
+    app_instance.state.config = config
+    _serve_prebuilt_openapi(app_instance)
+
+    # Compress JSON/HTML bodies (taxonomy and search payloads are large and
+    # repetitive). Added first so it sits innermost, inside rate limiting and
+    # CORS; Starlette skips text/event-stream, so the /mcp stream is untouched.
+    app_instance.add_middleware(
+        GZipMiddleware,  # type: ignore
+        minimum_size=1024,
+        compresslevel=5,
+    )
+
+    # Answer the liveness probe and the / redirect before routing. Inside rate
+    # limiting and CORS, so both still see (and decorate) these responses.
+    app_instance.add_middleware(FastPathInterceptor)  # type: ignore
 
     # App-level rate limiting (portable across Caddy/Traefik/Coolify/Railway).
     # Added before CORS so that CORS ends up the OUTERMOST middleware and its
@@ -294,27 +605,20 @@ def get_app() -> FastAPI:
             config=rate_limit_config,
         )
 
-    # Enable CORS as this is a public API by default.
+    # Enable CORS as this is a public API by default. Methods/headers are pinned
+    # (POST and the mcp-* headers are for browser MCP clients on /mcp) and
+    # preflights are cacheable for a day.
     app_instance.add_middleware(
         CORSMiddleware,  # type: ignore
         allow_origins=api_config.get("cors_origins", ["*"]),
         allow_credentials=False,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=api_config.get("cors_methods", _DEFAULT_CORS_METHODS),
+        allow_headers=api_config.get("cors_headers", _DEFAULT_CORS_HEADERS),
+        max_age=api_config.get("cors_max_age", 86400),
     )
 
     # Mount static files with appropriate cache headers
-    static_dir = Path(__file__).parent / "static"
-
-    # Check if the directory exists
-    if not static_dir.exists():
-        # Create the directory if it doesn't exist
-        try:
-            static_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            raise RuntimeError(
-                "Failed to create static directory: %s" % static_dir
-            ) from e
+    static_dir, templates_dir = _ensure_dirs(_STATIC_DIR, _TEMPLATES_DIR)
 
     # Cache-busting token derived from the newest static asset mtime; exposed to
     # templates as `asset_version` and appended to asset URLs as `?v=`.
@@ -324,23 +628,21 @@ def get_app() -> FastAPI:
         "/static", CachedStaticFiles(directory=static_dir), name="static"
     )
 
-    # Initialize Jinja2 templates
-    templates_dir = Path(__file__).parent / "templates" / "jinja2"
-
-    # Create templates directory if it doesn't exist
-    if not templates_dir.exists():
-        try:
-            templates_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            raise RuntimeError(
-                "Failed to create templates directory: %s" % templates_dir
-            ) from e
-
-    # Store templates instance in app state
-    app_instance.state.templates = Jinja2Templates(directory=templates_dir)
+    # Store templates instance in app state. Templates only change on deploy, so
+    # skip the per-render mtime check (auto_reload) and keep compiled bytecode
+    # in the default per-user temp cache so restarts don't re-parse sources.
+    templates_env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(templates_dir),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+    )
+    app_instance.state.templates = Jinja2Templates(env=templates_env)
 
     # Expose the cache-busting token to all templates (used as ?v= on assets).
     app_instance.state.templates.env.globals["asset_version"] = asset_version
+    app_instance.state.asset_version = asset_version
 
     # INTERIM FIX: Register strip_folio_prefix Jinja2 filter for human-readable property labels.
     # Remove this once https://github.com/alea-institute/FOLIO/pull/5 is merged and
@@ -355,14 +657,8 @@ def get_app() -> FastAPI:
     )
 
     # Attach the routes
-    app_instance.include_router(folio_api.routes.info.router)
-    app_instance.include_router(folio_api.routes.search.router)
-    app_instance.include_router(folio_api.routes.taxonomy.router)
-    app_instance.include_router(folio_api.routes.properties.router)
-    app_instance.include_router(folio_api.routes.explore.router)
-    app_instance.include_router(folio_api.routes.connections.router)
-    # root.router has /{iri} catch-all, so it must be registered last
-    app_instance.include_router(folio_api.routes.root.router)
+    for router in _ROUTERS:
+        app_instance.include_router(router)
 
     # Mount FOLIO MCP server at /mcp
     from folio_mcp.server import mcp as folio_mcp_server
@@ -372,15 +668,24 @@ def get_app() -> FastAPI:
     return app_instance
 
 
-# get instance from factory
-app = get_app()
-
 if __name__ == "__main__":
-    # Load the configuration and run the dev server
+    # Load the configuration and run the server. The app is created by uvicorn
+    # via the factory (in each worker), so importing this module never builds
+    # it; an import string is also required for uvicorn to honour workers > 1.
+    # loop/http default to "auto", which picks uvloop/httptools when they are
+    # installed (uvicorn[standard]).
     config = load_config()
     bind_host = config.get("api", {}).get("bind_ip", "0.0.0.0")
     bind_port = config.get("api", {}).get("bind_port", 8000)
-    uvicorn.run(app, host=bind_host, port=bind_port)
+    workers = config.get("api", {}).get("workers", 1)
+    uvicorn.run(
+        "folio_api.api:get_app",
+        factory=True,
+        host=bind_host,
+        port=bind_port,
+        workers=workers,
+    )
 
     # Alternatively, run the app on CLI from the uvicorn command:
-    # uvicorn folio_api.api:app --reload
+    # uvicorn folio_api.api:get_app --factory --reload
+    # uvicorn folio_api.api:get_app --factory --workers 4
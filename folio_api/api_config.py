@@ -3,15 +3,20 @@ API configuration module
 """
 
 # Standard library imports
+import functools
 import json
 from pathlib import Path
 from typing import Any, Dict
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     """
     Load configuration from config.json file
 
+    The file is read and parsed once per process; subsequent calls return the
+    same dictionary, so callers must treat it as read-only.
+
     Returns:
         Dict[str, Any]: Configuration dictionary
     """
@@ -0,0 +1,42 @@
+"""Pure-ASGI fast path for the liveness probe and the ``/`` redirect.
+
+Docker/Coolify/uptime probes hit ``GET /info/health`` every few seconds and
+load balancers often land on ``GET /``. Both answers are static for the life
+of the process, so this middleware replies to them directly instead of going
+through exception handling, routing and FastAPI's dependency/endpoint
+machinery. It sits inside CORS and rate limiting, so their headers and
+limits still apply exactly as before.
+
+Anything else (other paths, other methods, or a health check before the
+lifespan has built ``app.state.health_bytes``) is passed through untouched.
+"""
+
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+HEALTH_PATH = "/info/health"
+
+# Also returned by folio_api.routes.root.root_redirect; Response objects are
+# plain ASGI callables, so one instance can answer every request.
+ROOT_REDIRECT = Response(status_code=302, headers={"Location": "/explore/tree"})
+
+
+class FastPathInterceptor:
+    """Answer ``GET /info/health`` and ``GET /`` without entering the router."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET":
+            path = scope["path"]
+            if path == "/":
+                await ROOT_REDIRECT(scope, receive, send)
+                return
+            if path == HEALTH_PATH:
+                health_bytes = getattr(scope["app"].state, "health_bytes", None)
+                if health_bytes is not None:
+                    response = Response(health_bytes, media_type="application/json")
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
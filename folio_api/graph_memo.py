@@ -0,0 +1,70 @@
+"""
+Bounded per-graph memos for values derived from the FOLIO ontology.
+
+Resolved IRIs, neighbor walks, rendered pages, entity-graph payloads and
+search results only depend on the immutable graph, so routes memoize them.
+Each memo is a ``WeakKeyDictionary`` from the ``FOLIO`` instance to a plain
+dict: weak keys let a reloaded graph start from empty memos instead of
+serving stale data. Once a graph's dict reaches its size bound the oldest
+entry is evicted.
+"""
+
+# Standard library imports
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+GraphMemo = weakref.WeakKeyDictionary
+
+# Memos are filled from worker threads as well as the event loop; guards
+# creating a graph's dict and evicting from it.
+_lock = threading.Lock()
+
+
+def graph_cache(memo: GraphMemo, folio: Any) -> Dict:
+    """Return the memo dict for ``folio``, creating it on first use."""
+    cache = memo.get(folio)
+    if cache is None:
+        with _lock:
+            cache = memo.setdefault(folio, {})
+    return cache
+
+
+def store_bounded(cache: Dict, key: Hashable, value: Any, max_size: int) -> None:
+    """Insert into ``cache``, evicting the oldest entry once it is full."""
+    with _lock:
+        if len(cache) >= max_size:
+            # dicts preserve insertion order, so the first key is the oldest
+            cache.pop(next(iter(cache)), None)
+        cache[key] = value
+
+
+def memoized(
+    memo: GraphMemo,
+    max_size: int,
+    folio: Any,
+    key: Hashable,
+    compute: Callable[[], T],
+) -> T:
+    """
+    Return ``compute()`` memoized per graph under ``key``.
+
+    Args:
+        memo: The per-graph memo to use
+        max_size: Entries kept per graph before the oldest is evicted
+        folio: The graph the value is derived from
+        key: Key of the value within the graph's memo
+        compute: Zero-argument callable producing the value on a miss
+
+    Returns:
+        The cached or freshly computed value; callers share it and must not
+        mutate it
+    """
+    cache = graph_cache(memo, folio)
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        store_bounded(cache, key, value, max_size)
+    return value
@@ -6,6 +6,18 @@ schemas in the FOLIO API.
 """
 
 from folio_api.models.health import HealthResponse, FOLIOGraphInfo
-from folio_api.models.owl import OWLClassList, OWLObjectPropertyList, OWLSearchResults
+from folio_api.models.owl import (
+    OWLClassBatchRequest,
+    OWLClassList,
+    OWLObjectPropertyList,
+    OWLSearchResults,
+)
 
-__all__ = ["HealthResponse", "FOLIOGraphInfo", "OWLClassList", "OWLObjectPropertyList", "OWLSearchResults"]
+__all__ = [
+    "HealthResponse",
+    "FOLIOGraphInfo",
+    "OWLClassBatchRequest",
+    "OWLClassList",
+    "OWLObjectPropertyList",
+    "OWLSearchResults",
+]
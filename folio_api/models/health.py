@@ -9,7 +9,7 @@ that provide information about the API status and the loaded FOLIO ontology.
 from typing import Optional, Literal
 
 # Third-party imports
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class FOLIOGraphInfo(BaseModel):
@@ -44,50 +44,62 @@ class FOLIOGraphInfo(BaseModel):
         ```
     """
 
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
+            "example": {
+                "num_classes": 1025,
+                "num_properties": 175,
+                "title": "FOLIO Ontology",
+                "description": "Federated Open Legal Information Ontology",
+                "source_type": "github",
+                "http_url": None,
+                "github_repo_owner": "alea-institute",
+                "github_repo_name": "folio",
+                "github_repo_branch": "2.0.0",
+            }
+        }
+    )
+
     num_classes: int = Field(
-        description="Total number of ontology classes in the graph", example=1025, gt=0
+        description="Total number of ontology classes in the graph", gt=0
     )
 
     num_properties: int = Field(
         description="Total number of OWL object properties in the graph",
-        example=175,
         ge=0,
     )
 
     title: str = Field(
-        description="Title of the FOLIO ontology", example="FOLIO Ontology"
+        description="Title of the FOLIO ontology"
     )
 
     description: str = Field(
         description="Description of the FOLIO ontology",
-        example="Federated Open Legal Information Ontology",
     )
 
     source_type: Literal["http", "github"] = Field(
-        description="Source type of the ontology (http or github)", example="github"
+        description="Source type of the ontology (http or github)"
     )
 
     http_url: Optional[HttpUrl] = Field(
         description="HTTP URL of the ontology source (when source_type is 'http')",
-        example=None,
         default=None,
     )
 
     github_repo_owner: Optional[str] = Field(
         description="GitHub repository owner (when source_type is 'github')",
-        example="alea-institute",
         default=None,
     )
 
     github_repo_name: Optional[str] = Field(
         description="GitHub repository name (when source_type is 'github')",
-        example="folio",
         default=None,
     )
 
     github_repo_branch: Optional[str] = Field(
         description="GitHub repository branch (when source_type is 'github')",
-        example="2.0.0",
         default=None,
     )
 
@@ -121,8 +133,21 @@ class HealthResponse(BaseModel):
         ```
     """
 
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
+            "example": {
+                "status": "healthy",
+                "folio_graph": FOLIOGraphInfo.model_config["json_schema_extra"][
+                    "example"
+                ],
+            }
+        }
+    )
+
     status: Literal["healthy", "unhealthy"] = Field(
-        description="Health status of the API", example="healthy"
+        description="Health status of the API"
     )
 
     folio_graph: FOLIOGraphInfo = Field(
@@ -6,10 +6,10 @@ FOLIO ontology classes, object properties, and search results.
 """
 
 # Standard library imports
-from typing import List, Tuple, Union
+from typing import Annotated, Iterable, List, Tuple, Union
 
 # Third-party imports
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 from folio import OWLClass, OWLObjectProperty
 
 
@@ -41,6 +41,8 @@ class OWLClassList(BaseModel):
         ```
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     classes: List[OWLClass] = Field(
         description="List of OWLClass objects from the FOLIO ontology",
         example=[
@@ -65,6 +67,8 @@ class OWLObjectPropertyList(BaseModel):
         properties: A list of OWLObjectProperty objects representing FOLIO ontology object properties
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     properties: List[OWLObjectProperty] = Field(
         description="List of OWLObjectProperty objects from the FOLIO ontology",
         example=[
@@ -83,41 +87,98 @@ class OWLSearchResults(BaseModel):
 
     This model represents the results of search operations that return ontology
     classes along with relevance scores indicating how well each class matches
-    the search query.
+    the search query. Classes and scores are stored as parallel lists (one
+    homogeneous list each) rather than a list of mixed ``[class, score]`` pairs,
+    which is cheaper to validate and serialize.
 
     Attributes:
-        results: A list of tuples where each tuple contains an OWLClass and its
-                relevance score (higher scores indicate better matches)
+        classes: A list of OWLClass objects matching the search, best first
+        scores: Relevance scores aligned with ``classes`` (higher scores indicate
+                better matches)
 
     Example:
         ```json
         {
-          "results": [
-            [
-              {
-                "iri": "R8pNPutX0TN6DlEqkyZuxSw",
-                "label": "Lessor",
-                "definition": "A party that grants a right to use something in return for payment.",
-                ...
-              },
-              0.95
-            ],
+          "classes": [
+            {
+              "iri": "R8pNPutX0TN6DlEqkyZuxSw",
+              "label": "Lessor",
+              "definition": "A party that grants a right to use something in return for payment.",
+              ...
+            },
             ...
-          ]
+          ],
+          "scores": [0.95, ...]
         }
         ```
     """
 
-    results: List[Tuple[OWLClass, Union[int, float]]] = Field(
-        description="List of tuples containing OWLClass objects and their relevance scores",
-        example=[
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    classes: List[OWLClass] = Field(
+        default_factory=list,
+        description="List of OWLClass objects matching the search",
+        examples=[
             [
                 {
                     "iri": "R8pNPutX0TN6DlEqkyZuxSw",
                     "label": "Lessor",
                     "definition": "A party that grants a right to use something in return for payment.",
-                },
-                0.95,
+                }
             ]
         ],
     )
+    scores: List[float] = Field(
+        default_factory=list,
+        description="Relevance scores aligned index-for-index with classes",
+        examples=[[0.95]],
+    )
+
+    @classmethod
+    def from_hits(
+        cls, hits: Iterable[Tuple[OWLClass, Union[int, float]]]
+    ) -> "OWLSearchResults":
+        """
+        Build results from the ``(OWLClass, score)`` pairs returned by folio-python.
+
+        Args:
+            hits: Iterable of ``(OWLClass, score)`` tuples
+
+        Returns:
+            OWLSearchResults: The same hits split into parallel lists
+        """
+        classes: List[OWLClass] = []
+        scores: List[float] = []
+        for owl_class, score in hits:
+            classes.append(owl_class)
+            scores.append(float(score))
+        return cls(classes=classes, scores=scores)
+
+
+# Most IRIs accepted by one POST /classes request.
+MAX_BATCH_SIZE = 500
+# Longest IRI accepted in a batch; FOLIO IRIs are well under 100 characters.
+MAX_IRI_LENGTH = 512
+
+
+class OWLClassBatchRequest(BaseModel):
+    """
+    IRIs to resolve in a single ``POST /classes`` request.
+
+    Each IRI is accepted in any form ``GET /{iri}`` accepts (bare ID, full IRI
+    or ``folio:`` prefix).
+
+    Attributes:
+        iris: Up to ``MAX_BATCH_SIZE`` IRIs of classes or properties, each at
+            most ``MAX_IRI_LENGTH`` characters
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    iris: List[
+        Annotated[str, StringConstraints(min_length=1, max_length=MAX_IRI_LENGTH)]
+    ] = Field(
+        max_length=MAX_BATCH_SIZE,
+        description="IRIs of the classes or properties to retrieve",
+        examples=[["R8pNPutX0TN6DlEqkyZuxSw", "R7jHq0yJ5p0Gd1hE9NfSxTW"]],
+    )
@@ -0,0 +1,199 @@
+"""Shared on-disk snapshot of the parsed FOLIO ontology.
+
+``FOLIO(...)`` parses ~18k classes out of the OWL XML on every boot, and every
+uvicorn/gunicorn worker repeats that parse independently. The parsed graph is
+plain Python data (pydantic models, dicts, marisa tries), so we pickle it once
+after the first build and let every later worker/restart load the snapshot
+instead of re-parsing.
+
+Design:
+  * **Location:** a ``folio-api-<uid>`` directory, created ``0700``, under
+    ``$XDG_RUNTIME_DIR``, else ``/dev/shm`` (RAM-backed, shared by all workers
+    on the host), else the system temp dir.
+  * **Trust:** unpickling runs arbitrary code, so a snapshot is only loaded
+    if it is owned by the current user and not group- or world-writable.
+    A snapshot directory owned by someone else is not used at all.
+  * **Staleness:** the file name embeds a hash of everything that shapes the
+    build — the ``folio`` config block, the LLM effort/tier (they are baked
+    into ``llm_kwargs``) and the installed folio-python version. Changing any
+    of them simply misses the old snapshot. Delete the file to force a rebuild.
+  * **Concurrency:** builders serialize on an ``flock``-ed lock file so N
+    workers booting together parse once; the others wait, then load. The
+    snapshot is written to a temp file and ``os.replace``-d into place, so a
+    reader never sees a partial pickle.
+  * **Transient state:** the lxml tree/parser and the LLM client are not
+    picklable (and the tree is not used after parsing); they are dropped from
+    the snapshot and the caller re-attaches the LLM after loading.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pickle
+import stat
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+LOGGER = logging.getLogger("folio_api")
+
+# Attributes that cannot (or need not) be pickled; restored as ``None``.
+TRANSIENT_ATTRS = ("tree", "parser", "llm")
+
+
+def _owned_privately(stat_result: os.stat_result) -> bool:
+    """True if the current user owns the file and nobody else may write it."""
+    if not hasattr(os, "getuid"):  # pragma: no cover - non-POSIX platforms
+        return True
+    return stat_result.st_uid == os.getuid() and not stat_result.st_mode & 0o022
+
+
+def default_snapshot_dir() -> Optional[Path]:
+    """
+    Owner-only snapshot directory, preferring RAM-backed locations.
+
+    Returns ``None`` if the directory exists but belongs to another user, in
+    which case no snapshot is read or written.
+    """
+    candidates = [Path("/dev/shm"), Path(tempfile.gettempdir())]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        candidates.insert(0, Path(runtime_dir))
+    base = next(
+        (path for path in candidates if path.is_dir() and os.access(path, os.W_OK)),
+        candidates[-1],
+    )
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    directory = base / f"folio-api-{uid}"
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        dir_stat = os.lstat(directory)
+    except OSError:
+        LOGGER.warning("Cannot create snapshot directory %s", directory, exc_info=True)
+        return None
+    if not stat.S_ISDIR(dir_stat.st_mode) or not _owned_privately(dir_stat):
+        LOGGER.warning("Not using snapshot directory %s: not owned by us", directory)
+        return None
+    if dir_stat.st_mode & 0o077:
+        os.chmod(directory, 0o700)
+    return directory
+
+
+def snapshot_key(key_parts: Dict[str, Any]) -> str:
+    """Stable short hash of the inputs that determine the built ontology."""
+    try:
+        folio_version = version("folio-python")
+    except PackageNotFoundError:
+        folio_version = "unknown"
+    payload = json.dumps(
+        {"folio_python": folio_version, **key_parts}, sort_keys=True, default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=12).hexdigest()
+
+
+@contextlib.contextmanager
+def _exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive ``flock`` on ``lock_path`` (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    with open(lock_path, "a+b") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _read_snapshot(path: Path) -> Optional[Any]:
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except FileNotFoundError:
+        return None
+    except OSError:
+        LOGGER.warning("Ignoring unreadable ontology snapshot %s", path, exc_info=True)
+        return None
+    try:
+        with os.fdopen(fd, "rb") as snapshot_file:
+            # checked on the open descriptor, so the file cannot be swapped
+            if not _owned_privately(os.fstat(snapshot_file.fileno())):
+                LOGGER.warning("Refusing ontology snapshot %s: not owned by us", path)
+                return None
+            return pickle.load(snapshot_file)
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.warning("Ignoring unreadable ontology snapshot %s", path, exc_info=True)
+        return None
+
+
+def _write_snapshot(path: Path, obj: Any) -> None:
+    state = {
+        name: (None if name in TRANSIENT_ATTRS else value)
+        for name, value in vars(obj).items()
+    }
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as snapshot_file:
+            pickle.dump((type(obj), state), snapshot_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except Exception:  # pylint: disable=broad-except
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        LOGGER.warning("Failed to write ontology snapshot %s", path, exc_info=True)
+
+
+def _restore(snapshot: Any) -> Any:
+    cls, state = snapshot
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    return obj
+
+
+def load_or_build(
+    build: Callable[[], T],
+    key_parts: Dict[str, Any],
+    snapshot_dir: Optional[Path] = None,
+) -> T:
+    """Return the snapshot for ``key_parts`` if present, else ``build()`` it.
+
+    Args:
+        build: Zero-argument callable that constructs the object from scratch.
+        key_parts: JSON-serializable inputs that determine the built object.
+        snapshot_dir: Directory for the snapshot (default: see
+            :func:`default_snapshot_dir`).
+
+    Returns:
+        The restored or freshly built object. Attributes listed in
+        ``TRANSIENT_ATTRS`` are ``None`` on a restored object.
+    """
+    directory = snapshot_dir or default_snapshot_dir()
+    if directory is None:
+        return build()
+    path = directory / f"folio_graph_{snapshot_key(key_parts)}.pkl"
+
+    snapshot = _read_snapshot(path)
+    if snapshot is not None:
+        LOGGER.info("Loaded FOLIO ontology snapshot from %s", path)
+        return _restore(snapshot)
+
+    with _exclusive_lock(path.with_suffix(".lock")):
+        # another worker may have finished the build while we waited
+        snapshot = _read_snapshot(path)
+        if snapshot is not None:
+            LOGGER.info("Loaded FOLIO ontology snapshot from %s", path)
+            return _restore(snapshot)
+
+        obj = build()
+        _write_snapshot(path, obj)
+        return obj
@@ -6,6 +6,7 @@ ontology classes and related data structures.
 """
 
 from folio_api.rendering.html_formatter import (
+    clear_render_caches,
     format_label,
     format_description,
     get_node_neighbors,
@@ -15,9 +16,11 @@ from folio_api.rendering.html_formatter import (
     render_tailwind_html,
     strip_folio_prefix,
     english_alternative_labels,
+    typeahead_js_source,
 )
 
 __all__ = [
+    "clear_render_caches",
     "format_label",
     "format_description",
     "get_node_neighbors",
@@ -27,4 +30,5 @@ __all__ = [
     "render_tailwind_html",
     "strip_folio_prefix",
     "english_alternative_labels",
+    "typeahead_js_source",
 ]
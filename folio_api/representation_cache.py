@@ -0,0 +1,182 @@
+"""
+Bounded cache of rendered per-entity representations.
+
+The ontology is immutable for the lifetime of the process, so the Markdown,
+JSON-LD, OWL XML and HTML views of a class or property only need to be
+rendered once. The encoded bytes are kept in an LRU keyed by
+``(format, iri)`` and handed straight to a ``Response`` on later requests,
+together with a gzip copy compressed the first time a client asks for it.
+
+Bodies are deliberately kept in memory rather than spilled to files served
+with ``FileResponse``: uvicorn does not implement the ASGI ``pathsend``
+extension, so Starlette would read each file back in chunks on a worker
+thread instead of handing it to ``sendfile``, which is slower than writing
+the cached bytes directly.
+"""
+
+# Standard library imports
+import gzip
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+DEFAULT_MAX_SIZE = 4096
+
+# Size bound for caches whose keys come from clients, such as search queries.
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Compressed once per entry, so this can afford more than the middleware's 5.
+GZIP_COMPRESSLEVEL = 6
+
+
+class RepresentationCache:
+    """
+    LRU of encoded representations keyed by ``(format, iri)``.
+
+    ``max_size`` bounds the number of entries across all formats and
+    ``max_bytes``, when set, their total size; the least recently served
+    entry is evicted first, and a body larger than ``max_bytes`` is not
+    cached at all. Each entry holds the plain body and, once requested, its
+    gzip-compressed copy. The search routes keep their encoded responses in a
+    second instance keyed by ``(route, query)``, where clients choose the
+    keys and a short query can match thousands of classes, so that one is
+    bounded by size as well.
+    """
+
+    def __init__(
+        self, max_size: int = DEFAULT_MAX_SIZE, max_bytes: Optional[int] = None
+    ) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        # (format, iri) -> [body, gzipped body or None]
+        self._entries: "OrderedDict[Tuple[str, str], List[Optional[bytes]]]" = (
+            OrderedDict()
+        )
+        # total size of every cached body and gzipped copy
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, fmt: str, iri: str) -> Optional[bytes]:
+        """Return the cached bytes for ``(fmt, iri)``, or ``None`` on a miss."""
+        key = (fmt, iri)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached bodies and their gzipped copies."""
+        return self._bytes
+
+    def put(self, fmt: str, iri: str, data: bytes) -> None:
+        """Store ``data`` for ``(fmt, iri)``, evicting the oldest entries."""
+        self._discard((fmt, iri))
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+        self._entries[(fmt, iri)] = [data, None]
+        self._bytes += len(data)
+        self._evict()
+
+    def _discard(self, key: Tuple[str, str]) -> None:
+        """Remove ``key`` if cached."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= _entry_size(entry)
+
+    def _evict(self) -> None:
+        """Drop the least recently served entries until both bounds hold."""
+        while len(self._entries) > self.max_size or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= _entry_size(entry)
+
+    def get_or_render(
+        self, fmt: str, iri: str, render: Callable[[], Union[str, bytes]]
+    ) -> bytes:
+        """
+        Return the cached bytes for ``(fmt, iri)``, calling ``render`` on a miss.
+
+        Args:
+            fmt: Representation name, e.g. ``"markdown"``
+            iri: IRI of the resolved entity
+            render: Zero-argument callable producing the body; ``str`` results
+                are UTF-8 encoded before caching
+
+        Returns:
+            bytes: The encoded representation
+        """
+        data = self.get(fmt, iri)
+        if data is None:
+            data = render()
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            self.put(fmt, iri, data)
+        return data
+
+    def gzipped(self, fmt: str, iri: str) -> Optional[bytes]:
+        """
+        Return the gzip-compressed copy of a cached entry.
+
+        The body is compressed on the first call and the result is kept with
+        the entry, so every later gzip response is a lookup.
+
+        Returns:
+            Optional[bytes]: The compressed body, or ``None`` if ``(fmt, iri)``
+            is not cached
+        """
+        entry = self._entries.get((fmt, iri))
+        if entry is None:
+            return None
+        if entry[1] is None:
+            compressed = gzip.compress(entry[0], compresslevel=GZIP_COMPRESSLEVEL)
+            entry[1] = compressed
+            self._bytes += len(compressed)
+            self._evict()
+            return compressed
+        return entry[1]
+
+    def warm(
+        self,
+        fmt: str,
+        entities: Iterable[Any],
+        render: Callable[[Any], Union[str, bytes]],
+    ) -> None:
+        """
+        Render ``fmt`` for every entity up front.
+
+        Args:
+            fmt: Representation name, e.g. ``"markdown"``
+            entities: Objects with an ``iri`` attribute
+            render: Callable producing the body for one entity
+        """
+        self.preload(fmt, ((entity.iri, render(entity)) for entity in entities))
+
+    def preload(self, fmt: str, items: Iterable[Tuple[str, Union[str, bytes]]]) -> None:
+        """
+        Store already rendered ``(iri, body)`` pairs for ``fmt``.
+
+        Preloaded entries are added on top of ``max_size``, so a warm-up never
+        evicts itself and lazily rendered formats keep their full budget.
+        """
+        size_before = len(self._entries)
+        for iri, data in items:
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            self._discard((fmt, iri))
+            self._entries[(fmt, iri)] = [data, None]
+            self._bytes += len(data)
+        self.max_size += len(self._entries) - size_before
+
+    def clear(self) -> None:
+        """Drop every cached representation."""
+        self._entries.clear()
+        self._bytes = 0
+
+
+def _entry_size(entry: List[Optional[bytes]]) -> int:
+    """Bytes held by one entry's body and gzipped copy."""
+    return sum(len(data) for data in entry if data is not None)
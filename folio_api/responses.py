@@ -0,0 +1,62 @@
+"""
+Response classes shared by the API routes.
+"""
+
+# Standard library imports
+from typing import Any, Optional
+
+# Third-party imports
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+
+def orjson_dumps(content: Any) -> bytes:
+    """Encode ``content`` exactly as :class:`ORJSONResponse` renders it."""
+    return orjson.dumps(
+        content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an ``If-None-Match`` header value matches ``etag``.
+
+    Uses the weak comparison required for ``If-None-Match``: a ``W/`` prefix
+    on either side is ignored, and ``*`` matches any current representation.
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib ``json`` module.
+
+    Routes that build their payload as plain dicts/lists (jsTree data, entity
+    graphs, JSON-LD) return this directly. Routes with a ``response_model`` keep
+    FastAPI's default, which already serializes straight to bytes via
+    pydantic-core; ``fastapi.responses.ORJSONResponse`` is deprecated for that
+    reason, so we carry our own.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
+
+
+class PydanticORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that serializes pydantic models with ``model_dump_json``.
+
+    Returning a model instance from a route makes FastAPI validate it against
+    the ``response_model`` and encode it again; wrapping it in this response
+    hands it to pydantic-core's JSON encoder once. Anything else is rendered
+    like :class:`ORJSONResponse`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return super().render(content)
@@ -5,7 +5,9 @@ Connection routes for the FOLIO API — find semantic triples between concepts.
 # packages
 from fastapi import APIRouter, Request, status
 from folio import FOLIO
-from starlette.responses import JSONResponse
+
+# project
+from folio_api.responses import ORJSONResponse
 
 # API router
 router = APIRouter(tags=["ontology"])
@@ -24,7 +26,7 @@ async def find_connections(
     subject: str,
     property: str | None = None,
     object: str | None = None,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Find semantic connections (triples) for a given subject concept.
 
     Args:
@@ -44,7 +46,7 @@ async def find_connections(
         if not subject.startswith("http"):
             entity = folio[f"https://folio.openlegalstandard.org/{subject}"]
     if entity is None:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": f"Subject not found: {subject}"},
             status_code=status.HTTP_404_NOT_FOUND,
         )
@@ -62,4 +64,4 @@ async def find_connections(
             "property": {"iri": prop.iri, "label": prop.label},
             "object": {"iri": obj.iri, "label": obj.label},
         })
-    return JSONResponse(content=result)
+    return ORJSONResponse(content=result)
@@ -3,12 +3,19 @@ Unified explore routes for the FOLIO API — combined class + property tree view
 """
 
 # imports
-from pathlib import Path
+import weakref
+from typing import Dict, Tuple
 
 # packages
 from fastapi import APIRouter, Query, Request, status
 from folio import FOLIO, OWLClass, OWLObjectProperty
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
+
+# project
+from folio_api.graph_memo import memoized
+from folio_api.rendering import typeahead_js_source
+from folio_api.responses import ORJSONResponse, orjson_dumps
+from folio_api.serialization import json_bytes_response
 
 # API router
 router = APIRouter(prefix="/explore", tags=["explore"])
@@ -152,18 +159,20 @@ def _walk_entity_graph(folio: FOLIO, entity, etype: str):
     while queue and len(nodes) < _GRAPH_MAX_NODES:
         current = queue.pop(0)
         # Walk all parents (multi-inheritance per folio-mapper image)
-        for parent_iri in (getattr(current, parent_attr, None) or []):
+        for parent_iri in getattr(current, parent_attr, None) or []:
             if parent_iri == terminator:
                 continue
             key = (parent_iri, current.iri, "subClassOf")
             if key in seen_edges:
                 continue
             seen_edges.add(key)
-            edges.append({
-                "source": parent_iri,
-                "target": current.iri,
-                "relationship": "subClassOf",
-            })
+            edges.append(
+                {
+                    "source": parent_iri,
+                    "target": current.iri,
+                    "relationship": "subClassOf",
+                }
+            )
             if parent_iri not in nodes and len(nodes) < _GRAPH_MAX_NODES:
                 parent = get(parent_iri)
                 if parent:
@@ -171,16 +180,18 @@ def _walk_entity_graph(folio: FOLIO, entity, etype: str):
                     queue.append(parent)
         # rdfs:seeAlso (classes only — OWL object properties don't carry it)
         if etype == "class":
-            for related_iri in (getattr(current, "see_also", None) or []):
+            for related_iri in getattr(current, "see_also", None) or []:
                 key = (current.iri, related_iri, "seeAlso")
                 if key in seen_edges:
                     continue
                 seen_edges.add(key)
-                edges.append({
-                    "source": current.iri,
-                    "target": related_iri,
-                    "relationship": "seeAlso",
-                })
+                edges.append(
+                    {
+                        "source": current.iri,
+                        "target": related_iri,
+                        "relationship": "seeAlso",
+                    }
+                )
                 if related_iri not in nodes and len(nodes) < _GRAPH_MAX_NODES:
                     related = get(related_iri)
                     if related:
@@ -279,6 +290,36 @@ def _build_children_payload(folio, entity, etype, property_children):
     }
 
 
+# Encoded entity-graph payloads per graph, keyed by (entity IRI, mode). The
+# walk and its JSON only depend on the immutable ontology, so each is built
+# once.
+_GRAPH_PAYLOAD_CACHE_SIZE = 4096
+_PayloadMemo = Dict[Tuple[str, str], bytes]
+_graph_payload_cache: "weakref.WeakKeyDictionary[FOLIO, _PayloadMemo]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def clear_entity_graph_cache() -> None:
+    """Drop every memoized entity-graph payload."""
+    _graph_payload_cache.clear()
+
+
+def _entity_graph_body(folio, entity, etype, mode, property_children) -> bytes:
+    """JSON body of the entity-graph response, built and encoded once per mode."""
+    if mode == "ancestors":
+        build = _build_ancestors_payload
+    else:
+        build = _build_children_payload
+    return memoized(
+        _graph_payload_cache,
+        _GRAPH_PAYLOAD_CACHE_SIZE,
+        folio,
+        (entity.iri, mode),
+        lambda: orjson_dumps(build(folio, entity, etype, property_children)),
+    )
+
+
 @router.get(
     "/api/entity-graph/{iri:path}",
     response_model=None,
@@ -295,21 +336,17 @@ async def get_entity_graph(
     request: Request,
     iri: str,
     mode: str = Query("ancestors", regex="^(ancestors|children)$"),
-) -> JSONResponse:
+) -> Response:
     folio: FOLIO = request.app.state.folio
     property_children = getattr(request.app.state, "property_children", {})
     entity, etype = _resolve_entity(folio, iri)
     if entity is None:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": f"Entity not found: {iri}"},
             status_code=status.HTTP_404_NOT_FOUND,
         )
-    if mode == "ancestors":
-        return JSONResponse(
-            content=_build_ancestors_payload(folio, entity, etype, property_children)
-        )
-    return JSONResponse(
-        content=_build_children_payload(folio, entity, etype, property_children)
+    return json_bytes_response(
+        _entity_graph_body(folio, entity, etype, mode, property_children)
     )
 
 
@@ -323,14 +360,11 @@ async def get_entity_graph(
 )
 async def explore_tree(request: Request) -> Response:
     """Unified tree explorer combining classes (nouns) and properties (verbs)."""
-    typeahead_js_path = Path(__file__).parent.parent / "static" / "js" / "typeahead_search.js"
-    typeahead_js_source = typeahead_js_path.read_text(encoding="utf-8")
-
     return request.app.state.templates.TemplateResponse(
         "explore/tree.html",
         {
             "request": request,
-            "typeahead_js_source": typeahead_js_source,
+            "typeahead_js_source": typeahead_js_source(),
             "config": request.app.state.config,
         },
     )
@@ -7,14 +7,47 @@ Info routes for the API.
 # packages
 from fastapi import APIRouter, Request, status
 from folio import FOLIO
+from pydantic import HttpUrl
+from starlette.responses import Response
 
 # project
 from folio_api.models import HealthResponse, FOLIOGraphInfo
+from folio_api.serialization import json_bytes_response
 
 # API router
 router = APIRouter(prefix="/info", tags=["info"])
 
 
+def health_json(folio: FOLIO) -> bytes:
+    """
+    Encode the ``/info/health`` body for a loaded FOLIO graph.
+
+    The values come straight from our own FOLIO instance, so pydantic
+    validation is skipped (model_construct) and pydantic-core encodes the JSON.
+
+    Args:
+        folio: The loaded FOLIO graph
+
+    Returns:
+        bytes: The ``HealthResponse`` JSON
+    """
+    health_response = HealthResponse.model_construct(
+        status="healthy",
+        folio_graph=FOLIOGraphInfo.model_construct(
+            num_classes=len(folio),
+            num_properties=len(folio.object_properties),
+            title=folio.title,
+            description=folio.description,
+            source_type=folio.source_type,
+            http_url=HttpUrl(folio.http_url) if folio.http_url else None,
+            github_repo_owner=folio.github_repo_owner,
+            github_repo_name=folio.github_repo_name,
+            github_repo_branch=folio.github_repo_branch,
+        ),
+    )
+    return health_response.model_dump_json().encode("utf-8")
+
+
 @router.get(
     "/health",
     tags=["info"],
@@ -53,7 +86,7 @@ router = APIRouter(prefix="/info", tags=["info"])
         },
     },
 )
-async def health(request: Request) -> HealthResponse:
+async def health(request: Request) -> Response:
     """
     Check the health status of the API and retrieve information about the FOLIO ontology graph.
 
@@ -88,18 +121,6 @@ async def health(request: Request) -> HealthResponse:
     }
     ```
     """
-    folio: FOLIO = request.app.state.folio
-    return HealthResponse(
-        status="healthy",
-        folio_graph=FOLIOGraphInfo(
-            num_classes=len(folio),
-            num_properties=len(folio.object_properties),
-            title=folio.title,
-            description=folio.description,
-            source_type=folio.source_type,
-            http_url=folio.http_url,
-            github_repo_owner=folio.github_repo_owner,
-            github_repo_name=folio.github_repo_name,
-            github_repo_branch=folio.github_repo_branch,
-        ),
-    )
+    # Built once at startup (see health_json); the payload only changes when
+    # the ontology is reloaded, which means a restart.
+    return json_bytes_response(request.app.state.health_bytes)
@@ -3,15 +3,19 @@ Property routes for the FOLIO API — browse, tree, and detail views for OWL Obj
 """
 
 # imports
-from pathlib import Path
 
 # packages
 from fastapi import APIRouter, Request, status
 from folio import FOLIO, OWLObjectProperty
-from starlette.responses import Response, JSONResponse, RedirectResponse
+from starlette.responses import Response, RedirectResponse
 
 # project
-from folio_api.rendering import get_property_neighbors, strip_folio_prefix
+from folio_api.rendering import (
+    get_property_neighbors,
+    strip_folio_prefix,
+    typeahead_js_source,
+)
+from folio_api.responses import ORJSONResponse
 
 # API router
 router = APIRouter(prefix="/properties", tags=["properties"])
@@ -112,7 +116,7 @@ def _get_child_properties(folio: FOLIO, parent_iri: str, property_children: dict
     description="Retrieve all OWL object properties from the FOLIO ontology",
     status_code=status.HTTP_200_OK,
 )
-async def get_all_properties(request: Request) -> JSONResponse:
+async def get_all_properties(request: Request) -> ORJSONResponse:
     """Get all OWL object properties defined in the FOLIO ontology.
 
     Returns a JSON object with a 'properties' array, each containing
@@ -134,7 +138,7 @@ async def get_all_properties(request: Request) -> JSONResponse:
         if prop.sub_property_of:
             d["sub_property_of"] = prop.sub_property_of
         result.append(d)
-    return JSONResponse(content={"properties": result})
+    return ORJSONResponse(content={"properties": result})
 
 
 @router.get(
@@ -175,15 +179,12 @@ async def browse_properties(request: Request) -> Response:
             "range_summary": ", ".join(range_labels[:3]) + ("..." if len(range_labels) > 3 else "") if range_labels else "",
         })
 
-    typeahead_js_path = Path(__file__).parent.parent / "static" / "js" / "typeahead_search.js"
-    typeahead_js_source = typeahead_js_path.read_text(encoding="utf-8")
-
     return request.app.state.templates.TemplateResponse(
         "properties/browse.html",
         {
             "request": request,
             "root_data": root_data,
-            "typeahead_js_source": typeahead_js_source,
+            "typeahead_js_source": typeahead_js_source(),
             "config": request.app.state.config,
         },
     )
@@ -214,7 +215,7 @@ async def explore_property_tree(request: Request) -> Response:
     description="Get hierarchical data for the property tree view",
     status_code=status.HTTP_200_OK,
 )
-async def get_property_tree_data(request: Request, node_id: str = "#") -> JSONResponse:
+async def get_property_tree_data(request: Request, node_id: str = "#") -> ORJSONResponse:
     """Get hierarchical data for the property tree (lazy-load compatible)."""
     folio: FOLIO = request.app.state.folio
     property_children = getattr(request.app.state, "property_children", None)
@@ -236,7 +237,7 @@ async def get_property_tree_data(request: Request, node_id: str = "#") -> JSONRe
                     "type": "root_property",
                 },
             })
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
     else:
         # Return children of a specific property
         children = _get_child_properties(folio, node_id, property_children)
@@ -253,7 +254,7 @@ async def get_property_tree_data(request: Request, node_id: str = "#") -> JSONRe
                     "type": "sub_property",
                 },
             })
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
 
 
 @router.get(
@@ -264,14 +265,14 @@ async def get_property_tree_data(request: Request, node_id: str = "#") -> JSONRe
     description="Get detailed data for a single property node",
     status_code=status.HTTP_200_OK,
 )
-async def get_property_node_data(request: Request, iri: str) -> JSONResponse:
+async def get_property_node_data(request: Request, iri: str) -> ORJSONResponse:
     """Get detailed data for a single property node by IRI."""
     folio: FOLIO = request.app.state.folio
     property_children = getattr(request.app.state, "property_children", None)
 
     prop = _find_property(folio, iri)
     if not prop:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": f"Property not found for identifier: {iri}"},
             status_code=status.HTTP_404_NOT_FOUND,
         )
@@ -357,7 +358,7 @@ async def get_property_node_data(request: Request, iri: str) -> JSONResponse:
         "edges": edges,
     }
 
-    return JSONResponse(content=result)
+    return ORJSONResponse(content=result)
 
 
 @router.get(
@@ -368,13 +369,13 @@ async def get_property_node_data(request: Request, iri: str) -> JSONResponse:
     description="Get the complete path from root to a specific property in the tree",
     status_code=status.HTTP_200_OK,
 )
-async def get_property_path(request: Request, iri: str) -> JSONResponse:
+async def get_property_path(request: Request, iri: str) -> ORJSONResponse:
     """Get the complete path from root to a specific property."""
     folio: FOLIO = request.app.state.folio
 
     prop = _find_property(folio, iri)
     if not prop:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": f"Property not found for identifier: {iri}"},
             status_code=status.HTTP_404_NOT_FOUND,
         )
@@ -403,7 +404,7 @@ async def get_property_path(request: Request, iri: str) -> JSONResponse:
         else:
             break
 
-    return JSONResponse(content={"path": path})
+    return ORJSONResponse(content={"path": path})
 
 
 @router.get(
@@ -414,12 +415,12 @@ async def get_property_path(request: Request, iri: str) -> JSONResponse:
     description="Search for properties and return a filtered tree structure",
     status_code=status.HTTP_200_OK,
 )
-async def search_property_tree(request: Request, query: str) -> JSONResponse:
+async def search_property_tree(request: Request, query: str) -> ORJSONResponse:
     """Search for properties and return a filtered tree structure."""
     folio: FOLIO = request.app.state.folio
 
     if not query or len(query) < 2:
-        return JSONResponse(content={"matches": [], "tree": {}})
+        return ORJSONResponse(content={"matches": [], "tree": {}})
 
     def _get_match_field(prop, q_lower):
         """Determine which field matched the search query."""
@@ -467,7 +468,7 @@ async def search_property_tree(request: Request, query: str) -> JSONResponse:
             search_results.append(prop)
 
     if not search_results:
-        return JSONResponse(content={"matches": [], "tree": {}})
+        return ORJSONResponse(content={"matches": [], "tree": {}})
 
     # Build filtered tree
     included_nodes = set()
@@ -545,7 +546,7 @@ async def search_property_tree(request: Request, query: str) -> JSONResponse:
         key=lambda n: tree["nodes"].get(n, {}).get("label", "").lower()
     )
 
-    return JSONResponse(content={"matches": matches, "tree": tree})
+    return ORJSONResponse(content={"matches": matches, "tree": tree})
 
 
 @router.get(
@@ -3,15 +3,39 @@ Root API routes for IRI resolution.
 """
 
 # imports
-import json
+import asyncio
+import functools
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 # packages
-from fastapi import APIRouter, Request, status
+import jinja2
+import lxml.etree
+import orjson
+from fastapi import APIRouter, HTTPException, Request, status
 from folio import FOLIO, OWLClass, OWLObjectProperty
-from starlette.responses import JSONResponse, Response
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse
 
 # project
-from folio_api.rendering import get_node_neighbors, get_property_neighbors, strip_folio_prefix
+from folio_api.asgi_health import ROOT_REDIRECT
+from folio_api.graph_memo import graph_cache, store_bounded
+from folio_api.models import OWLClassBatchRequest
+from folio_api.rendering import (
+    clear_render_caches,
+    get_node_neighbors,
+    get_property_neighbors,
+    strip_folio_prefix,
+    typeahead_js_source,
+)
+from folio_api.representation_cache import RepresentationCache
+from folio_api.routes.explore import clear_entity_graph_cache
+from folio_api.routes.search import clear_search_cache
+from folio_api.responses import etag_matches, orjson_dumps
+from folio_api.serialization import ClassJSONCache, json_bytes_response
 
 # API router
 router = APIRouter(prefix="", tags=["ontology"])
@@ -19,13 +43,167 @@ router = APIRouter(prefix="", tags=["ontology"])
 # The OWL top-level property IRI
 OWL_TOP_OBJECT_PROPERTY = "http://www.w3.org/2002/07/owl#topObjectProperty"
 
+# 404 bodies for unresolvable IRIs, encoded once
+_NOT_FOUND_JSON = orjson.dumps({"message": "Entity not found."})
+_NOT_FOUND_TEXT = b"Entity not found."
+
+# Bodies below this size go out uncompressed; matches GZipMiddleware's
+# minimum_size in folio_api.api.
+_GZIP_MINIMUM_SIZE = 1024
+
+# Per-graph memo of _resolve_iri results, misses included: an unknown IRI
+# costs a suffix scan of every class and property, and scanners keep probing
+# the same few paths.
+_RESOLVE_CACHE_SIZE = 8192
+_resolve_cache: "weakref.WeakKeyDictionary[FOLIO, Dict[str, Tuple]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Entity representations only change when the ontology or the app is
+# redeployed; clients revalidate against the build-wide ETag after an hour.
+_ENTITY_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
 
-def _resolve_iri(folio: FOLIO, iri: str):
-    """Resolve an IRI to either a class or property.
+
+def _representations(request: Request) -> RepresentationCache:
+    """The app's cache of rendered Markdown/JSON-LD/XML/HTML bodies."""
+    return request.app.state.representations
+
+
+def _cache_headers(request: Request) -> Dict[str, str]:
+    """``ETag``/``Cache-Control`` sent with every successful /{iri} response."""
+    return {
+        "ETag": request.app.state.entity_etag,
+        "Cache-Control": _ENTITY_CACHE_CONTROL,
+    }
+
+
+def _not_modified(request: Request) -> Optional[Response]:
+    """
+    A bodiless 304 when ``If-None-Match`` carries the current build's ETag.
+
+    The ETag is shared by every entity and format, so this is checked before
+    anything is rendered.
+    """
+    if etag_matches(
+        request.headers.get("if-none-match"), request.app.state.entity_etag
+    ):
+        return NotModifiedResponse(Headers(_cache_headers(request)))
+    return None
+
+
+def _representation_response(
+    request: Request,
+    fmt: str,
+    iri: str,
+    render: Callable[[], Union[str, bytes]],
+    media_type: str,
+) -> Response:
+    """
+    Serve a cached representation, gzip-compressed when the client accepts it.
+
+    The compressed copy is made once per cache entry. GZipMiddleware passes
+    responses that already carry ``Content-Encoding`` through untouched.
+    """
+    cache = _representations(request)
+    body = cache.get_or_render(fmt, iri, render)
+    headers = _cache_headers(request)
+    if len(body) >= _GZIP_MINIMUM_SIZE and "gzip" in request.headers.get(
+        "accept-encoding", ""
+    ):
+        body = cache.gzipped(fmt, iri)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+# Class representations pre-rendered by warm_representations, in the order
+# _render_class_formats returns them after the IRI.
+_WARM_FORMATS = ("markdown", "jsonld", "xml")
+
+# Classes sent to a warm-up worker per task.
+_WARM_CHUNK_SIZE = 256
+
+
+def _render_class_formats(owl_class: OWLClass) -> Tuple[str, str, bytes, bytes]:
+    """IRI, Markdown, JSON-LD and OWL XML of one class (picklable for workers)."""
+    return (
+        owl_class.iri,
+        owl_class.to_markdown(),
+        _render_jsonld(owl_class, "class"),
+        _render_owl_xml(owl_class, "class"),
+    )
+
+
+def warm_representations(
+    cache: RepresentationCache, folio: FOLIO, workers: int = 0
+) -> None:
+    """
+    Pre-render the Markdown, JSON-LD and OWL XML of every class and property.
+
+    HTML is left to fill lazily: it is rendered through the request-bound
+    template environment.
+
+    Args:
+        cache: The app's representation cache
+        folio: The loaded FOLIO graph
+        workers: Render classes in this many spawned processes; 0 renders
+            them in-process
+    """
+    if workers > 0:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            rendered = list(
+                pool.map(
+                    _render_class_formats, folio.classes, chunksize=_WARM_CHUNK_SIZE
+                )
+            )
+    else:
+        rendered = [_render_class_formats(owl_class) for owl_class in folio.classes]
+    for column, fmt in enumerate(_WARM_FORMATS, start=1):
+        cache.preload(fmt, ((row[0], row[column]) for row in rendered))
+
+    # Properties are few, and their Markdown resolves labels through the graph.
+    properties = folio.object_properties
+    cache.warm(
+        "markdown",
+        properties,
+        functools.partial(_render_markdown, folio, entity_type="property"),
+    )
+    cache.warm(
+        "jsonld", properties, functools.partial(_render_jsonld, entity_type="property")
+    )
+    cache.warm(
+        "xml", properties, functools.partial(_render_owl_xml, entity_type="property")
+    )
+
+
+def _resolve_iri(
+    folio: FOLIO, iri: str, memoize_misses: bool = True, suffix_scan: bool = True
+):
+    """Resolve an IRI to either a class or property, memoized per graph.
+
+    Args:
+        folio: The loaded FOLIO graph
+        iri: IRI in any form ``GET /{iri}`` accepts
+        memoize_misses: Whether to remember IRIs that do not resolve
+        suffix_scan: Whether to fall back to scanning every entity for an IRI
+            suffix match when the direct lookups fail
 
     Returns:
         tuple: (entity, entity_type) where entity_type is "class", "property", or None
     """
+    resolved_iris = graph_cache(_resolve_cache, folio)
+    resolved = resolved_iris.get(iri)
+    if resolved is None:
+        resolved = _find_entity(folio, iri, suffix_scan)
+        if resolved[0] is not None or memoize_misses:
+            store_bounded(resolved_iris, iri, resolved, _RESOLVE_CACHE_SIZE)
+    return resolved
+
+
+def _find_entity(folio: FOLIO, iri: str, suffix_scan: bool = True):
+    """Look an IRI up as a class or property, trying each lookup strategy."""
     # Try class first
     owl_class = folio[iri]
     if owl_class:
@@ -48,19 +226,23 @@ def _resolve_iri(folio: FOLIO, iri: str):
             if prop:
                 return prop, "property"
 
-    # Strategy 3: Prepend FOLIO prefix
+    # Strategy 3: Prepend FOLIO prefix. FOLIO lookups normalize a bare ID to
+    # exactly this IRI, in which case strategy 1 has already probed it.
     if not iri.startswith("http"):
         full_iri = f"https://folio.openlegalstandard.org/{iri}"
-        owl_class = folio[full_iri]
-        if owl_class:
-            return owl_class, "class"
-        prop = folio.get_property(full_iri)
-        if prop:
-            return prop, "property"
+        if folio.normalize_iri(iri) != full_iri:
+            owl_class = folio[full_iri]
+            if owl_class:
+                return owl_class, "class"
+            prop = folio.get_property(full_iri)
+            if prop:
+                return prop, "property"
 
     # Strategy 4: Scan all for suffix match
+    if not suffix_scan:
+        return None, None
     for cls in folio.classes:
-        if hasattr(cls, "iri") and (cls.iri.endswith(iri) or iri.endswith(cls.iri)):
+        if cls.iri.endswith(iri) or iri.endswith(cls.iri):
             return cls, "class"
     for p in folio.object_properties:
         if p.iri.endswith(iri) or iri.endswith(p.iri):
@@ -104,12 +286,81 @@ async def root_redirect() -> Response:
     HTTP Status Codes:
     - 302 Found: Redirect to the ontology explorer
     """
+    return ROOT_REDIRECT
+
+
+@router.post(
+    "/admin/cache/clear",
+    include_in_schema=False,
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def clear_representation_cache(request: Request) -> Response:
+    """
+    Drop every cached rendering so the next request re-renders it.
+
+    Disabled (404) unless ``api.cache_admin`` is true in config.json.
+    """
+    if not request.app.state.config["api"].get("cache_admin", False):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    _representations(request).clear()
+    request.app.state.search_responses.clear()
+    clear_render_caches()
+    clear_entity_graph_cache()
+    clear_search_cache()
+    _resolve_cache.clear()
     return Response(
-        status_code=status.HTTP_302_FOUND,
-        headers={"Location": "/explore/tree"},
+        status_code=status.HTTP_204_NO_CONTENT, headers={"Cache-Control": "no-store"}
     )
 
 
+def _resolve_batch(folio: FOLIO, iris: List[str]) -> Dict[str, object]:
+    """
+    Resolve each distinct IRI of a batch, dropping those that do not resolve.
+
+    Each IRI gets the direct lookups of ``GET /{iri}`` but not its suffix
+    scan over every entity, so a batch of unknown IRIs stays cheap. Misses are
+    not memoized, so such a batch cannot flush the resolver cache either.
+    """
+    found: Dict[str, object] = {}
+    for iri in iris:
+        if iri not in found:
+            entity, _ = _resolve_iri(
+                folio, iri, memoize_misses=False, suffix_scan=False
+            )
+            if entity:
+                found[iri] = entity
+    return found
+
+
+@router.post(
+    "/classes",
+    tags=["ontology"],
+    response_model=Dict[str, OWLClass],
+    summary="Get Classes by IRI (batch)",
+    description="Retrieves several classes or properties in one request, keyed by IRI",
+    status_code=status.HTTP_200_OK,
+)
+async def get_classes(request: Request, batch: OWLClassBatchRequest) -> Response:
+    """
+    Retrieve several FOLIO classes or properties in a single request.
+
+    The body is ``{"iris": [...]}``; each IRI may be a bare ID, a full IRI or
+    ``folio:``-prefixed, as for `GET /{iri}`, but unlike that route a batch does
+    not fall back to matching IRI suffixes. The response maps every requested
+    IRI that resolved to the same JSON `GET /{iri}` returns for it; IRIs that do
+    not resolve are omitted.
+
+    HTTP Status Codes:
+    - 200 OK: Successfully resolved the batch (possibly to an empty object)
+    - 422 Unprocessable Entity: Malformed body, an empty or overlong IRI, or
+      more than 500 IRIs
+    """
+    # Resolve off the event loop; a full batch is still 500 lookups.
+    found = await asyncio.to_thread(_resolve_batch, request.app.state.folio, batch.iris)
+    cache: ClassJSONCache = request.app.state.class_json
+    return json_bytes_response(cache.mapping(found.items()))
+
+
 @router.get(
     "/{iri}",
     tags=["ontology"],
@@ -140,7 +391,7 @@ async def root_redirect() -> Response:
         },
     },
 )
-async def get_class(request: Request, iri: str) -> OWLClass:
+async def get_class(request: Request, iri: str) -> Response:
     """
     Retrieve detailed information about a FOLIO ontology class or property by its IRI in JSON format.
 
@@ -158,55 +409,26 @@ async def get_class(request: Request, iri: str) -> OWLClass:
     folio: FOLIO = request.app.state.folio
     entity, entity_type = _resolve_iri(folio, iri)
     if not entity:
-        return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content={"message": "Entity not found."},
-        )
+        return json_bytes_response(_NOT_FOUND_JSON, status.HTTP_404_NOT_FOUND)
 
-    return entity
+    not_modified = _not_modified(request)
+    if not_modified is not None:
+        return not_modified
 
+    # Serve the entity JSON encoded at startup instead of re-validating and
+    # re-encoding the model; response_model still documents the schema.
+    cache: ClassJSONCache = request.app.state.class_json
+    return Response(
+        content=cache.fragment(entity),
+        media_type="application/json",
+        headers=_cache_headers(request),
+    )
 
-@router.get(
-    "/{iri}/markdown",
-    tags=["ontology"],
-    response_model=None,
-    summary="Get Class by IRI (Markdown)",
-    description="Retrieves ontology class information by its IRI identifier in Markdown format",
-    status_code=status.HTTP_200_OK,
-    responses={
-        status.HTTP_200_OK: {
-            "description": "Successfully retrieved class information in Markdown format",
-            "content": {
-                "text/markdown": {
-                    "example": "# Lessor\n\nA party that grants a right to use something in return for payment.\n\n## Taxonomy\n\n* Parent class: Party\n* Child classes: None\n\n## Properties\n\n* grants_rights"
-                }
-            },
-        },
-        status.HTTP_404_NOT_FOUND: {
-            "description": "Class not found",
-            "content": {"text/plain": {"example": "Class not found."}},
-        },
-    },
-)
-async def get_class_markdown(request: Request, iri: str) -> Response:
-    """
-    Retrieve information about a FOLIO ontology entity by its IRI in Markdown format.
-
-    HTTP Status Codes:
-    - 200 OK: Successfully retrieved entity information in Markdown format
-    - 404 Not Found: The requested IRI does not exist in the ontology
-    """
-    folio: FOLIO = request.app.state.folio
-    entity, entity_type = _resolve_iri(folio, iri)
-    if not entity:
-        return Response(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content="Entity not found.",
-            media_type="text/plain",
-        )
 
+def _render_markdown(folio: FOLIO, entity, entity_type: str) -> str:
+    """Markdown view of a resolved class or property."""
     if entity_type == "class":
-        return Response(content=entity.to_markdown(), media_type="text/markdown")
+        return entity.to_markdown()
 
     # Inline markdown for properties (OWLObjectProperty lacks to_markdown())
     prop = entity
@@ -255,56 +477,78 @@ async def get_class_markdown(request: Request, iri: str) -> Response:
         # INTERIM: strip_folio_prefix can be removed once FOLIO PR #5 is merged
         lines.append(f"- {strip_folio_prefix(inv.label) if inv else prop.inverse_of}")
         lines.append("")
-    return Response(content="\n".join(lines), media_type="text/markdown")
+    return "\n".join(lines)
 
 
 @router.get(
-    "/{iri}/jsonld",
+    "/{iri}/markdown",
     tags=["ontology"],
     response_model=None,
-    summary="Get Class by IRI (JSON-LD)",
-    description="Retrieves ontology class information by its IRI identifier in JSON-LD format",
+    summary="Get Class by IRI (Markdown)",
+    description="Retrieves ontology class information by its IRI identifier in Markdown format",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Successfully retrieved class information in Markdown format",
+            "content": {
+                "text/markdown": {
+                    "example": "# Lessor\n\nA party that grants a right to use something in return for payment.\n\n## Taxonomy\n\n* Parent class: Party\n* Child classes: None\n\n## Properties\n\n* grants_rights"
+                }
+            },
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Class not found",
+            "content": {"text/plain": {"example": "Class not found."}},
+        },
+    },
 )
-async def get_class_jsonld(request: Request, iri: str) -> JSONResponse:
+async def get_class_markdown(request: Request, iri: str) -> Response:
     """
-    Retrieve information about a FOLIO ontology class by its IRI in JSON-LD format.
+    Retrieve information about a FOLIO ontology entity by its IRI in Markdown format.
 
-    This endpoint returns the class information in JSON-LD (JSON for Linking Data) format,
-    which is designed for representing linked data with support for semantic web concepts.
+    HTTP Status Codes:
+    - 200 OK: Successfully retrieved entity information in Markdown format
+    - 404 Not Found: The requested IRI does not exist in the ontology
+    """
+    folio: FOLIO = request.app.state.folio
+    entity, entity_type = _resolve_iri(folio, iri)
+    if not entity:
+        return Response(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content=_NOT_FOUND_TEXT,
+            media_type="text/plain",
+        )
 
-    JSON-LD is particularly useful for:
-    - Semantic web applications
-    - Linked data integration
-    - Providing context for JSON data
-    - Machine-readable semantics
+    not_modified = _not_modified(request)
+    if not_modified is not None:
+        return not_modified
 
-    Example URLs:
-    - `/R8pNPutX0TN6DlEqkyZuxSw/jsonld` - Returns the Lessor class in JSON-LD format
+    return _representation_response(
+        request,
+        "markdown",
+        entity.iri,
+        functools.partial(_render_markdown, folio, entity, entity_type),
+        media_type="text/markdown",
+    )
 
-    The response includes the '@context' object that maps properties to IRIs, making the
-    data semantically meaningful for linked data applications.
 
-    If the IRI does not exist in the ontology, a 404 error is returned.
-    """
+# Shared by every property's JSON-LD; orjson only reads it.
+_PROPERTY_JSONLD_CONTEXT = {
+    "owl": "http://www.w3.org/2002/07/owl#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "folio": "https://folio.openlegalstandard.org/",
+}
 
-    folio: FOLIO = request.app.state.folio
-    entity, entity_type = _resolve_iri(folio, iri)
-    if not entity:
-        return JSONResponse(status_code=404, content={"message": "Entity not found."})
 
+def _render_jsonld(entity, entity_type: str) -> bytes:
+    """Encoded JSON-LD view of a resolved class or property."""
     if entity_type == "class":
-        return JSONResponse(
-            content=entity.to_jsonld(), media_type="application/ld+json"
-        )
+        return orjson_dumps(entity.to_jsonld())
 
     # Inline JSON-LD for properties
     prop = entity
     jsonld = {
-        "@context": {
-            "owl": "http://www.w3.org/2002/07/owl#",
-            "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-            "folio": "https://folio.openlegalstandard.org/",
-        },
+        "@context": _PROPERTY_JSONLD_CONTEXT,
         "@type": "owl:ObjectProperty",
         "@id": prop.iri,
         "rdfs:label": prop.label,
@@ -318,31 +562,34 @@ async def get_class_jsonld(request: Request, iri: str) -> JSONResponse:
         jsonld["rdfs:range"] = prop.range
     if prop.inverse_of:
         jsonld["owl:inverseOf"] = prop.inverse_of
-    return JSONResponse(content=jsonld, media_type="application/ld+json")
+    return orjson_dumps(jsonld)
 
 
 @router.get(
-    "/{iri}/xml",
+    "/{iri}/jsonld",
     tags=["ontology"],
     response_model=None,
-    summary="Get Class by IRI (OWL XML)",
-    description="Retrieves ontology class information by its IRI identifier in OWL XML format",
+    summary="Get Class by IRI (JSON-LD)",
+    description="Retrieves ontology class information by its IRI identifier in JSON-LD format",
 )
-async def get_class_xml(request: Request, iri: str) -> Response:
+async def get_class_jsonld(request: Request, iri: str) -> Response:
     """
-    Retrieve information about a FOLIO ontology class by its IRI in OWL XML format.
+    Retrieve information about a FOLIO ontology class by its IRI in JSON-LD format.
 
-    This endpoint returns the class information in Web Ontology Language (OWL) XML format,
-    which is the standard XML serialization format for OWL ontologies.
+    This endpoint returns the class information in JSON-LD (JSON for Linking Data) format,
+    which is designed for representing linked data with support for semantic web concepts.
 
-    The OWL XML format is particularly useful for:
-    - Ontology tools that work with the OWL standard
-    - Integration with semantic web frameworks
-    - Formal reasoning systems
-    - Compatibility with ontology editors like Protégé
+    JSON-LD is particularly useful for:
+    - Semantic web applications
+    - Linked data integration
+    - Providing context for JSON data
+    - Machine-readable semantics
 
     Example URLs:
-    - `/R8pNPutX0TN6DlEqkyZuxSw/xml` - Returns the Lessor class in OWL XML format
+    - `/R8pNPutX0TN6DlEqkyZuxSw/jsonld` - Returns the Lessor class in JSON-LD format
+
+    The response includes the '@context' object that maps properties to IRIs, making the
+    data semantically meaningful for linked data applications.
 
     If the IRI does not exist in the ontology, a 404 error is returned.
     """
@@ -350,12 +597,29 @@ async def get_class_xml(request: Request, iri: str) -> Response:
     folio: FOLIO = request.app.state.folio
     entity, entity_type = _resolve_iri(folio, iri)
     if not entity:
-        return Response(
-            status_code=404, content=json.dumps({"message": "Entity not found."})
-        )
+        return json_bytes_response(_NOT_FOUND_JSON, status.HTTP_404_NOT_FOUND)
+
+    not_modified = _not_modified(request)
+    if not_modified is not None:
+        return not_modified
+
+    return _representation_response(
+        request,
+        "jsonld",
+        entity.iri,
+        functools.partial(_render_jsonld, entity, entity_type),
+        media_type="application/ld+json",
+    )
+
 
+def _render_owl_xml(entity, entity_type: str) -> Union[str, bytes]:
+    """OWL XML view of a resolved class or property."""
     if entity_type == "class":
-        return Response(content=entity.to_owl_xml(), media_type="application/xml")
+        # Same serialization as OWLClass.to_owl_xml(), kept as the UTF-8 bytes
+        # lxml produces instead of decoding them only to re-encode for caching.
+        return lxml.etree.tostring(
+            entity.to_owl_element(), pretty_print=True, encoding="utf-8"
+        )
 
     # Inline OWL XML for properties
     prop = entity
@@ -366,9 +630,9 @@ async def get_class_xml(request: Request, iri: str) -> Response:
         f'  <ObjectProperty IRI="{prop.iri}">',
     ]
     if prop.label:
-        xml_parts.append(f'    <rdfs:label>{prop.label}</rdfs:label>')
+        xml_parts.append(f"    <rdfs:label>{prop.label}</rdfs:label>")
     if prop.definition:
-        xml_parts.append(f'    <rdfs:comment>{prop.definition}</rdfs:comment>')
+        xml_parts.append(f"    <rdfs:comment>{prop.definition}</rdfs:comment>")
     for p_iri in prop.sub_property_of:
         xml_parts.append(f'    <SubObjectPropertyOf IRI="{p_iri}"/>')
     for d_iri in prop.domain:
@@ -377,55 +641,58 @@ async def get_class_xml(request: Request, iri: str) -> Response:
         xml_parts.append(f'    <ObjectPropertyRange IRI="{r_iri}"/>')
     if prop.inverse_of:
         xml_parts.append(f'    <InverseObjectProperties IRI="{prop.inverse_of}"/>')
-    xml_parts.append('  </ObjectProperty>')
-    xml_parts.append('</Ontology>')
-    return Response(content="\n".join(xml_parts), media_type="application/xml")
+    xml_parts.append("  </ObjectProperty>")
+    xml_parts.append("</Ontology>")
+    return "\n".join(xml_parts)
 
 
 @router.get(
-    "/{iri}/html",
+    "/{iri}/xml",
     tags=["ontology"],
     response_model=None,
-    summary="Get Class by IRI (HTML)",
-    description="Retrieves ontology class information by its IRI identifier in a human-readable HTML format",
+    summary="Get Class by IRI (OWL XML)",
+    description="Retrieves ontology class information by its IRI identifier in OWL XML format",
 )
-async def get_class_html(request: Request, iri: str) -> Response:
+async def get_class_xml(request: Request, iri: str) -> Response:
     """
-    Retrieve information about a FOLIO ontology class by its IRI in a rich HTML format.
-
-    This endpoint returns an interactive HTML representation of the requested class, styled with
-    Tailwind CSS for a modern, responsive design. The HTML format is ideal for:
+    Retrieve information about a FOLIO ontology class by its IRI in OWL XML format.
 
-    - Human-readable browsing of the ontology
-    - Educational purposes and learning about FOLIO
-    - Sharing class information with non-technical stakeholders
-    - Quick reference of class properties and relationships
+    This endpoint returns the class information in Web Ontology Language (OWL) XML format,
+    which is the standard XML serialization format for OWL ontologies.
 
-    The HTML view includes:
-    - Class label and definition
-    - Hierarchical view of parent and child classes
-    - Properties and relationships
-    - Interactive elements for navigation
+    The OWL XML format is particularly useful for:
+    - Ontology tools that work with the OWL standard
+    - Integration with semantic web frameworks
+    - Formal reasoning systems
+    - Compatibility with ontology editors like Protégé
 
     Example URLs:
-    - `/R8pNPutX0TN6DlEqkyZuxSw/html` - Returns the Lessor class in HTML format
+    - `/R8pNPutX0TN6DlEqkyZuxSw/xml` - Returns the Lessor class in OWL XML format
 
     If the IRI does not exist in the ontology, a 404 error is returned.
     """
+
     folio: FOLIO = request.app.state.folio
     entity, entity_type = _resolve_iri(folio, iri)
     if not entity:
-        return Response(
-            status_code=404, content=json.dumps({"message": "Entity not found."})
-        )
+        return json_bytes_response(_NOT_FOUND_JSON, status.HTTP_404_NOT_FOUND)
+
+    not_modified = _not_modified(request)
+    if not_modified is not None:
+        return not_modified
+
+    return _representation_response(
+        request,
+        "xml",
+        entity.iri,
+        functools.partial(_render_owl_xml, entity, entity_type),
+        media_type="application/xml",
+    )
 
-    # Import JavaScript for typeahead search
-    from pathlib import Path
 
-    typeahead_js_path = (
-        Path(__file__).parent.parent / "static" / "js" / "typeahead_search.js"
-    )
-    typeahead_js_source = typeahead_js_path.read_text(encoding="utf-8")
+def _render_html(request: Request, folio: FOLIO, entity, entity_type: str) -> str:
+    """HTML page for a resolved class or property."""
+    templates: jinja2.Environment = request.app.state.templates.env
 
     if entity_type == "class":
         owl_class = entity
@@ -437,15 +704,18 @@ async def get_class_html(request: Request, iri: str) -> Response:
         for p in folio.object_properties:
             if owl_class.iri in p.domain:
                 # INTERIM: strip_folio_prefix can be removed once FOLIO PR #5 is merged
-                domain_properties.append({"iri": p.iri, "label": strip_folio_prefix(p.label or p.iri)})
+                domain_properties.append(
+                    {"iri": p.iri, "label": strip_folio_prefix(p.label or p.iri)}
+                )
             if owl_class.iri in p.range:
                 # INTERIM: strip_folio_prefix can be removed once FOLIO PR #5 is merged
-                range_properties.append({"iri": p.iri, "label": strip_folio_prefix(p.label or p.iri)})
+                range_properties.append(
+                    {"iri": p.iri, "label": strip_folio_prefix(p.label or p.iri)}
+                )
         domain_properties.sort(key=lambda x: x["label"].lower())
         range_properties.sort(key=lambda x: x["label"].lower())
 
-        return request.app.state.templates.TemplateResponse(
-            "taxonomy/class_detail.html",
+        return templates.get_template("taxonomy/class_detail.html").render(
             {
                 "request": request,
                 "owl_class": owl_class,
@@ -453,7 +723,7 @@ async def get_class_html(request: Request, iri: str) -> Response:
                 "nodes": nodes,
                 "edges": edges,
                 "config": request.app.state.config,
-                "typeahead_js_source": typeahead_js_source,
+                "typeahead_js_source": typeahead_js_source(),
                 "domain_properties": domain_properties,
                 "range_properties": range_properties,
             },
@@ -472,14 +742,23 @@ async def get_class_html(request: Request, iri: str) -> Response:
         parent = folio.get_property(parent_iri)
         if parent:
             # INTERIM: strip_folio_prefix can be removed once FOLIO PR #5 is merged
-            parents.append({"iri": parent.iri, "label": strip_folio_prefix(parent.label or "Unnamed Property")})
+            parents.append(
+                {
+                    "iri": parent.iri,
+                    "label": strip_folio_prefix(parent.label or "Unnamed Property"),
+                }
+            )
     parents.sort(key=lambda x: x["label"].lower())
 
     # Build children list
     from folio_api.routes.properties import _get_child_properties
+
     children_props = _get_child_properties(folio, prop.iri, property_children)
     # INTERIM: strip_folio_prefix can be removed once FOLIO PR #5 is merged
-    children = [{"iri": c.iri, "label": strip_folio_prefix(c.label or "Unnamed Property")} for c in children_props]
+    children = [
+        {"iri": c.iri, "label": strip_folio_prefix(c.label or "Unnamed Property")}
+        for c in children_props
+    ]
 
     # Domain/range classes
     domain_classes = []
@@ -502,10 +781,12 @@ async def get_class_html(request: Request, iri: str) -> Response:
         inv = folio.get_property(prop.inverse_of)
         if inv:
             # INTERIM: strip_folio_prefix can be removed once FOLIO PR #5 is merged
-            inverse_data = {"iri": inv.iri, "label": strip_folio_prefix(inv.label or "Unnamed Property")}
+            inverse_data = {
+                "iri": inv.iri,
+                "label": strip_folio_prefix(inv.label or "Unnamed Property"),
+            }
 
-    return request.app.state.templates.TemplateResponse(
-        "properties/property_detail.html",
+    return templates.get_template("properties/property_detail.html").render(
         {
             "request": request,
             "prop": prop,
@@ -513,7 +794,7 @@ async def get_class_html(request: Request, iri: str) -> Response:
             "nodes": nodes,
             "edges": edges,
             "config": request.app.state.config,
-            "typeahead_js_source": typeahead_js_source,
+            "typeahead_js_source": typeahead_js_source(),
             "parents": parents,
             "children": children,
             "domain_classes": domain_classes,
@@ -521,3 +802,51 @@ async def get_class_html(request: Request, iri: str) -> Response:
             "inverse_data": inverse_data,
         },
     )
+
+
+@router.get(
+    "/{iri}/html",
+    tags=["ontology"],
+    response_model=None,
+    summary="Get Class by IRI (HTML)",
+    description="Retrieves ontology class information by its IRI identifier in a human-readable HTML format",
+)
+async def get_class_html(request: Request, iri: str) -> Response:
+    """
+    Retrieve information about a FOLIO ontology class by its IRI in a rich HTML format.
+
+    This endpoint returns an interactive HTML representation of the requested class, styled with
+    Tailwind CSS for a modern, responsive design. The HTML format is ideal for:
+
+    - Human-readable browsing of the ontology
+    - Educational purposes and learning about FOLIO
+    - Sharing class information with non-technical stakeholders
+    - Quick reference of class properties and relationships
+
+    The HTML view includes:
+    - Class label and definition
+    - Hierarchical view of parent and child classes
+    - Properties and relationships
+    - Interactive elements for navigation
+
+    Example URLs:
+    - `/R8pNPutX0TN6DlEqkyZuxSw/html` - Returns the Lessor class in HTML format
+
+    If the IRI does not exist in the ontology, a 404 error is returned.
+    """
+    folio: FOLIO = request.app.state.folio
+    entity, entity_type = _resolve_iri(folio, iri)
+    if not entity:
+        return json_bytes_response(_NOT_FOUND_JSON, status.HTTP_404_NOT_FOUND)
+
+    not_modified = _not_modified(request)
+    if not_modified is not None:
+        return not_modified
+
+    return _representation_response(
+        request,
+        "html",
+        entity.iri,
+        functools.partial(_render_html, request, folio, entity, entity_type),
+        media_type="text/html",
+    )
@@ -3,16 +3,48 @@ Search routes.
 """
 
 # imports
+import asyncio
+import bisect
+import functools
+import threading
+import weakref
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+    Union,
+)
 
 # packages
-from fastapi import APIRouter, Request, HTTPException, status
-from folio import FOLIO
+import rapidfuzz
+from fastapi import APIRouter, Query, Request, status
+from folio import FOLIO, OWLClass, OWLObjectProperty
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse
 
 # project
+from folio_api.graph_memo import memoized
 from folio_api.models import OWLClassList, OWLSearchResults, OWLObjectPropertyList
+from folio_api.representation_cache import RepresentationCache
+from folio_api.responses import ORJSONResponse, etag_matches
+from folio_api.serialization import (
+    ClassJSONCache,
+    class_list_response,
+    json_bytes_response,
+    property_list_response,
+)
 
-# API router
-router = APIRouter(prefix="/search", tags=["search"])
+# API router. Every route returns a pre-encoded body; orjson is the default
+# for anything that ever hands FastAPI plain content instead.
+router = APIRouter(
+    prefix="/search", tags=["search"], default_response_class=ORJSONResponse
+)
 
 # set min and max query length defaults
 MIN_QUERY_LENGTH = 2
@@ -21,18 +53,426 @@ MAX_QUERY_LENGTH = 1024
 # default depth
 DEFAULT_MAX_DEPTH = 3
 
+# Length limits are enforced during parameter validation, so out-of-range
+# queries get a 422 before any handler runs.
+SEARCH_QUERY = Query(..., min_length=MIN_QUERY_LENGTH, max_length=MAX_QUERY_LENGTH)
+
+# Per-graph memo of folio text search results keyed by (search, query):
+# autocomplete and popular labels repeat the same queries against an
+# ontology that never changes.
+_SEARCH_CACHE_SIZE = 4096
+_SearchMemo = Dict[Tuple[str, Union[str, int]], List]
+_search_cache: "weakref.WeakKeyDictionary[FOLIO, _SearchMemo]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# LLM candidate sets keyed by (getter, max_depth), which every LLM request
+# would otherwise rebuild by walking a subgraph. Kept apart from the text
+# search memo so a burst of distinct queries cannot evict them.
+_SEARCH_SET_CACHE_SIZE = 256
+_search_sets: "weakref.WeakKeyDictionary[FOLIO, _SearchMemo]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Indexes are built on worker threads; guards publishing a graph's index.
+_search_cache_lock = threading.Lock()
+
+# Text search results only change with the ontology build, so browsers and
+# shared caches may reuse them briefly and then revalidate against the same
+# build-wide ETag as the /{iri} representations.
+_SEARCH_CACHE_CONTROL = "public, max-age=600, stale-while-revalidate=60"
+
+
+async def _cached_search_response(
+    request: Request,
+    search: str,
+    query: str,
+    render: Callable[[FOLIO, ClassJSONCache, str], bytes],
+) -> Response:
+    """
+    JSON response for ``search``/``query``, rendered once and kept as bytes.
+
+    A miss renders on a worker thread. Bodies live in
+    ``app.state.search_responses`` so a repeated query is a dictionary lookup;
+    they are built from the app's ``class_json`` fragments and so follow its
+    ``exclude_none`` setting. Responses carry the build's ETag, and a matching
+    ``If-None-Match`` gets a bodiless 304 before anything is looked up.
+
+    Callers pass the query already normalized to the form their results
+    depend on, so case or punctuation variants of a query share one entry.
+
+    The graph and the JSON fragment cache are only looked up on a miss, so a
+    cache hit reads nothing from ``app.state`` but the ETag and the bodies.
+
+    Args:
+        request (Request): The incoming request
+        search (str): Name of the search route, e.g. ``"label"``
+        query (str): The normalized query string
+        render (Callable[[FOLIO, ClassJSONCache, str], bytes]): Builds the body
+            from the graph, the fragment cache and the query on a miss
+
+    Returns:
+        Response: The JSON response
+    """
+    state = request.app.state
+    headers = {
+        "ETag": state.entity_etag,
+        "Cache-Control": _SEARCH_CACHE_CONTROL,
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return NotModifiedResponse(Headers(headers))
+
+    bodies: RepresentationCache = state.search_responses
+    body = bodies.get(search, query)
+    if body is None:
+        # The folio searches scan the whole ontology; run them on a worker
+        # thread so the event loop keeps serving other requests meanwhile.
+        body = await asyncio.to_thread(render, state.folio, state.class_json, query)
+        bodies.put(search, query, body)
+    return json_bytes_response(body, headers=headers)
 
-def query_length_check(query: str) -> bool:
+
+def clear_search_cache() -> None:
+    """Drop every memoized search result, search set and search index."""
+    _search_cache.clear()
+    _search_sets.clear()
+    _label_indexes.clear()
+    _definition_indexes.clear()
+
+
+def _memoized_search(folio: FOLIO, search: str, query: str) -> List:
     """
-    Check if the query string is at least 2 characters long.
+    Return ``folio.<search>(query)``, memoized per graph.
+
+    Searches listed in ``_LOCAL_SEARCHES`` run this module's equivalent
+    implementation instead of the FOLIO method.
 
     Args:
-        query (str): Query string
+        folio (FOLIO): The loaded FOLIO graph
+        search (str): Name of the FOLIO method, e.g. ``"search_by_label"``
+        query (str): The query string
 
     Returns:
-        bool: True if the query string is at least 2 characters long
+        List: The search results
+    """
+    local_search = _LOCAL_SEARCHES.get(search)
+    if local_search is not None:
+        run = functools.partial(local_search, folio, query)
+    else:
+        run = functools.partial(getattr(folio, search), query)
+    return memoized(
+        _search_cache, _SEARCH_CACHE_SIZE, folio, (search, query), lambda: list(run())
+    )
+
+
+def _memoized_search_set(folio: FOLIO, getter: str, max_depth: int) -> List[OWLClass]:
+    """Return the LLM candidate set ``folio.<getter>(max_depth)``, memoized."""
+    return memoized(
+        _search_sets,
+        _SEARCH_SET_CACHE_SIZE,
+        folio,
+        (getter, max_depth),
+        lambda: list(getattr(folio, getter)(max_depth)),
+    )
+
+
+async def _search_set(folio: FOLIO, getter: str, max_depth: int) -> List[OWLClass]:
+    """
+    LLM candidate set ``folio.<getter>(max_depth)``, built once per graph and depth.
+
+    The first request for a depth walks the subgraph on a worker thread; later
+    ones reuse the memoized list.
+    """
+    search_set = _search_sets.get(folio, {}).get((getter, max_depth))
+    if search_set is None:
+        search_set = await asyncio.to_thread(
+            _memoized_search_set, folio, getter, max_depth
+        )
+    return search_set
+
+
+def warm_search_indexes(folio: FOLIO) -> None:
+    """
+    Build the label and definition indexes when the ontology is loaded.
+
+    They hold every name and definition already lowercased, so building them
+    at startup keeps that pass out of the first prefix and definition
+    searches.
+    """
+    _label_index(folio)
+    _definition_index(folio)
+
+
+def warm_search_sets(
+    folio: FOLIO, depths: Iterable[int] = (DEFAULT_MAX_DEPTH,)
+) -> None:
+    """
+    Build every LLM candidate set for each of ``depths`` up front.
+
+    Otherwise the first request to each ``/search/llm/*`` route and depth
+    walks its subgraph before the model is called.
+    """
+    for max_depth in depths:
+        for getter in ("get_areas_of_law", *_LLM_SEARCH_SETS.values()):
+            _memoized_search_set(folio, getter, max_depth)
+
+
+async def _llm_search_response(
+    request: Request, query: str, getter: str, max_depth: int
+) -> Response:
+    """
+    Results of an LLM search over the candidate set ``folio.<getter>(max_depth)``.
+
+    Each search is a full LLM round-trip, so the encoded results are kept in
+    ``app.state.search_responses`` under ``("llm/<getter>/<max_depth>", query)``
+    and a repeated query is answered without calling the model. A failed LLM
+    call raises and is not cached.
+
+    Args:
+        request (Request): The incoming request
+        query (str): Natural-language query
+        getter (str): Name of the FOLIO method building the candidate set
+        max_depth (int): Depth of the candidate subgraph
+
+    Returns:
+        Response: ``OWLSearchResults`` JSON
+    """
+    search = f"llm/{getter}/{max_depth}"
+    bodies: RepresentationCache = request.app.state.search_responses
+    body = bodies.get(search, query)
+    if body is None:
+        folio: FOLIO = request.app.state.folio
+        cache: ClassJSONCache = request.app.state.class_json
+        search_set = await _search_set(folio, getter, max_depth)
+        body = cache.search_results(
+            await folio.search_by_llm(query=query, search_set=search_set)
+        )
+        bodies.put(search, query, body)
+    return json_bytes_response(body)
+
+
+class _PackedNames(NamedTuple):
+    """Casefolded names of a list of entities packed into one string."""
+
+    # every entity's casefolded names, in index order, joined by _NAME_SEPARATOR
+    text: str
+    # offset in ``text`` where each entity's names begin
+    starts: List[int]
+    # length of the longest single name; no longer query can match
+    longest: int
+
+
+# Never part of a label, so a match cannot span two names.
+_NAME_SEPARATOR = "\x00"
+
+
+class _LabelIndex(NamedTuple):
+    """Entities searched by ``/search/prefix`` and their packed names."""
+
+    # in ontology order; classes without a primary label are left out, as the
+    # substring search skips them
+    classes: List[OWLClass]
+    properties: List[OWLObjectProperty]
+    # label, alternative labels and preferred label of each entity above
+    class_names: _PackedNames
+    property_names: _PackedNames
+    # IRI -> position in ``classes``
+    class_positions: Dict[str, int]
+
+
+_label_indexes: "weakref.WeakKeyDictionary[FOLIO, _LabelIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _label_index(folio: FOLIO) -> _LabelIndex:
+    """
+    The graph's :class:`_LabelIndex`, built on first use.
+
+    Casefolding every name once here turns the per-query substring search
+    into one ``str.find`` scan.
+    """
+    index = _label_indexes.get(folio)
+    if index is None:
+        classes = [owl_class for owl_class in folio.classes if owl_class.label]
+        properties = list(folio.object_properties)
+        index = _LabelIndex(
+            classes=classes,
+            properties=properties,
+            class_names=_pack_names(classes),
+            property_names=_pack_names(properties),
+            class_positions={
+                owl_class.iri: position for position, owl_class in enumerate(classes)
+            },
+        )
+        with _search_cache_lock:
+            index = _label_indexes.setdefault(folio, index)
+    return index
+
+
+def _pack_names(entities: List[Union[OWLClass, OWLObjectProperty]]) -> _PackedNames:
+    """Pack the casefolded names of ``entities`` into one string."""
+    blocks = []
+    starts = []
+    offset = 0
+    longest = 0
+    for entity in entities:
+        names = [
+            name.casefold()
+            for name in (
+                entity.label,
+                *(entity.alternative_labels or ()),
+                entity.preferred_label,
+            )
+            if name
+        ]
+        longest = max(longest, *map(len, names), 0)
+        block = _NAME_SEPARATOR.join(names)
+        blocks.append(block)
+        starts.append(offset)
+        offset += len(block) + len(_NAME_SEPARATOR)
+    return _PackedNames(_NAME_SEPARATOR.join(blocks), starts, longest)
+
+
+def _packed_matches(packed: _PackedNames, query_folded: str) -> Iterator[int]:
+    """Positions, in order, of the entities with a name containing the query."""
+    if len(query_folded) > packed.longest or _NAME_SEPARATOR in query_folded:
+        return
+    text, starts, _ = packed
+    position = text.find(query_folded)
+    while position != -1:
+        entity = bisect.bisect_right(starts, position) - 1
+        yield entity
+        if entity + 1 == len(starts):
+            return
+        position = text.find(query_folded, starts[entity + 1])
+
+
+def _prefix_matches(
+    folio: FOLIO, query: str
+) -> Tuple[List[OWLClass], List[OWLObjectProperty]]:
+    """
+    Classes and properties matched by ``/search/prefix``.
+
+    Case-insensitive label prefix matches come first, followed by classes
+    whose label, alternative or preferred labels contain the query; properties
+    are matched by substring the same way. Both compare casefolded text.
+
+    Returns:
+        Tuple[List[OWLClass], List[OWLObjectProperty]]: Matching classes and properties
+    """
+    # folio-python looks prefixes up in its casefolded label trie
+    prefix_results = _memoized_search(folio, "search_by_prefix", query)
+    label_index = _label_index(folio)
+    # flags the index positions already returned, so the substring pass below
+    # skips them with a byte read instead of hashing each IRI
+    seen = bytearray(len(label_index.classes))
+    for owl_class in prefix_results:
+        position = label_index.class_positions.get(owl_class.iri)
+        if position is not None:
+            seen[position] = 1
+
+    # Then every labelled class whose label, alternative or preferred labels
+    # contain the query, from the precomputed label index; each position is
+    # yielded once
+    query_folded = query.casefold()
+    label_results = [
+        label_index.classes[position]
+        for position in _packed_matches(label_index.class_names, query_folded)
+        if not seen[position]
+    ]
+
+    # Also search properties
+    property_results = [
+        label_index.properties[position]
+        for position in _packed_matches(label_index.property_names, query_folded)
+    ]
+
+    # Combine results, with prefix matches first
+    return prefix_results + label_results, property_results
+
+
+class _DefinitionIndex(NamedTuple):
+    """Class definitions searched by ``/search/definition``, preprocessed once."""
+
+    # parallel lists in ontology order, over classes that have a definition
+    classes: List[OWLClass]
+    # rapidfuzz's default_process (lowercased, punctuation stripped) output
+    texts: List[str]
+    # length of each original definition, the tie-breaker for equal scores
+    lengths: List[int]
+
+
+_definition_indexes: "weakref.WeakKeyDictionary[FOLIO, _DefinitionIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _definition_index(folio: FOLIO) -> _DefinitionIndex:
+    """The graph's :class:`_DefinitionIndex`, built on first use."""
+    index = _definition_indexes.get(folio)
+    if index is None:
+        defined = [c for c in folio.classes if c.definition is not None]
+        index = _DefinitionIndex(
+            classes=defined,
+            texts=[rapidfuzz.utils.default_process(c.definition) for c in defined],
+            lengths=[len(c.definition) for c in defined],
+        )
+        with _search_cache_lock:
+            index = _definition_indexes.setdefault(folio, index)
+    return index
+
+
+def _search_by_definition(
+    folio: FOLIO, query: str, limit: int = 10
+) -> List[Tuple[OWLClass, Union[int, float]]]:
+    """
+    Same results as ``folio.search_by_definition(query, limit)``.
+
+    FOLIO preprocesses every definition with rapidfuzz's ``default_process``
+    on each call. This scores the query against definitions preprocessed
+    once per graph, with the same scorer, limit and tie-breaking.
+    """
+    index = _definition_index(folio)
+    hits = rapidfuzz.process.extract(
+        rapidfuzz.utils.default_process(query),
+        index.texts,
+        scorer=rapidfuzz.fuzz.partial_token_set_ratio,
+        processor=None,
+        limit=limit,
+    )
+    hits.sort(key=lambda hit: (-hit[1], index.lengths[hit[2]]))
+    return [(index.classes[position], score) for _, score, position in hits]
+
+
+# Searches _memoized_search runs here rather than on the graph.
+_LOCAL_SEARCHES: Dict[str, Callable[[FOLIO, str], List]] = {
+    "search_by_definition": _search_by_definition,
+}
+
+
+def _fuzzy_search_key(query: str) -> str:
+    """
+    Normalized form of a label or definition search query.
+
+    Both searches score with rapidfuzz after running the query through its
+    ``default_process`` (lowercased, punctuation replaced by spaces, trimmed),
+    so queries with the same processed form get the same results.
     """
-    return MIN_QUERY_LENGTH <= len(query) <= MAX_QUERY_LENGTH
+    return rapidfuzz.utils.default_process(query)
+
+
+# Body renderers for _cached_search_response, one per text search route.
+def _render_prefix(folio: FOLIO, cache: ClassJSONCache, query: str) -> bytes:
+    return cache.class_list(*_prefix_matches(folio, query))
+
+
+def _render_label(folio: FOLIO, cache: ClassJSONCache, query: str) -> bytes:
+    return cache.search_results(_memoized_search(folio, "search_by_label", query))
+
+
+def _render_definition(folio: FOLIO, cache: ClassJSONCache, query: str) -> bytes:
+    return cache.search_results(_memoized_search(folio, "search_by_definition", query))
 
 
 @router.get(
@@ -59,17 +499,9 @@ def query_length_check(query: str) -> bool:
                 }
             },
         },
-        status.HTTP_400_BAD_REQUEST: {
-            "description": "Invalid query parameter",
-            "content": {
-                "application/json": {
-                    "example": {"detail": "Query must be between 2 and 1024 characters"}
-                }
-            },
-        },
     },
 )
-async def search_prefix(request: Request, query: str) -> OWLClassList:
+async def search_prefix(request: Request, query: str = SEARCH_QUERY) -> Response:
     """
     Search for FOLIO ontology classes whose labels start with or contain the provided search string.
 
@@ -88,7 +520,7 @@ async def search_prefix(request: Request, query: str) -> OWLClassList:
 
     Requirements:
     - Query must be at least 2 characters long (limited to 1024 characters)
-    - An HTTP 400 error is returned if query length requirements are not met
+    - An HTTP 422 error is returned if query length requirements are not met
     - A successful response with an empty array is returned if no matches are found
 
     Example response:
@@ -106,137 +538,11 @@ async def search_prefix(request: Request, query: str) -> OWLClassList:
     }
     ```
     """
-    # check query length
-    if len(query) < MIN_QUERY_LENGTH:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Query must be at least {MIN_QUERY_LENGTH} characters long",
-        )
-    if len(query) > MAX_QUERY_LENGTH:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Query exceeds maximum length of {MAX_QUERY_LENGTH} characters",
-        )
-
-    folio: FOLIO = request.app.state.folio
-
-    # First, try to get results with original case
-    prefix_results_original = folio.search_by_prefix(query)
-
-    # Then try with lowercase
-    query_lower = query.lower()
-    prefix_results_lower = (
-        [] if query == query_lower else folio.search_by_prefix(query_lower)
-    )
-
-    # Then try with uppercase first letter
-    query_title = query.title()
-    prefix_results_title = (
-        [] if query == query_title else folio.search_by_prefix(query_title)
+    # prefix and substring matching both compare casefolded text
+    return await _cached_search_response(
+        request, "prefix", query.casefold(), _render_prefix
     )
 
-    # Then get label matches that aren't already in prefix results
-    label_results = []
-
-    # Combine prefix results with deduplication
-    prefix_results = []
-    seen_iris = set()
-
-    # Add results in order of priority but avoid duplicates
-    for result_list in [
-        prefix_results_original,
-        prefix_results_lower,
-        prefix_results_title,
-    ]:
-        for owl_class in result_list:
-            if owl_class.iri not in seen_iris:
-                seen_iris.add(owl_class.iri)
-                prefix_results.append(owl_class)
-
-    # Check all classes for substring matches
-    # In the FOLIO library, classes is a list of OWLClass objects
-    for owl_class in folio.classes:
-        # Skip if we've already seen this IRI in prefix results
-        if owl_class.iri in seen_iris:
-            continue
-
-        # Skip if class has no label
-        if not owl_class.label:
-            continue
-
-        # Check if query is in the label (case-insensitive)
-        # Also check alternative labels for matches
-        label_match = False
-
-        # Check main label
-        if owl_class.label:
-            if (
-                query in owl_class.label
-                or query_lower in owl_class.label.lower()
-                or query_title in owl_class.label
-            ):
-                label_match = True
-
-        # Check alternative labels
-        if not label_match and owl_class.alternative_labels:
-            for alt_label in owl_class.alternative_labels:
-                if alt_label and (
-                    query in alt_label
-                    or query_lower in alt_label.lower()
-                    or query_title in alt_label
-                ):
-                    label_match = True
-                    break
-
-        # Check preferred label (skos:prefLabel)
-        if not label_match and owl_class.preferred_label:
-            if (
-                query in owl_class.preferred_label
-                or query_lower in owl_class.preferred_label.lower()
-                or query_title in owl_class.preferred_label
-            ):
-                label_match = True
-
-        if label_match:
-            seen_iris.add(owl_class.iri)
-            label_results.append(owl_class)
-
-    # Combine results, with prefix matches first
-    results = prefix_results + label_results
-
-    # Also search properties
-    property_results = []
-    for prop in folio.object_properties:
-        label_match = False
-        if prop.label and (
-            query in prop.label
-            or query_lower in prop.label.lower()
-            or query_title in prop.label
-        ):
-            label_match = True
-        if not label_match and prop.alternative_labels:
-            for alt in prop.alternative_labels:
-                if alt and (
-                    query in alt
-                    or query_lower in alt.lower()
-                    or query_title in alt
-                ):
-                    label_match = True
-                    break
-        # Check preferred label (skos:prefLabel)
-        if not label_match and prop.preferred_label:
-            if (
-                query in prop.preferred_label
-                or query_lower in prop.preferred_label.lower()
-                or query_title in prop.preferred_label
-            ):
-                label_match = True
-        if label_match:
-            property_results.append(prop)
-
-    # Return 200 OK with results (empty array if no matches)
-    return OWLClassList(classes=results, properties=property_results)
-
 
 @router.get(
     "/label",
@@ -245,7 +551,7 @@ async def search_prefix(request: Request, query: str) -> OWLClassList:
     summary="Search by Label Content",
     description="Find ontology classes whose labels contain the given query string, with relevance scores",
 )
-async def search_label(request: Request, query: str) -> OWLSearchResults:
+async def search_label(request: Request, query: str = SEARCH_QUERY) -> Response:
     """
     Search for FOLIO ontology classes whose labels contain the provided query string.
 
@@ -264,35 +570,31 @@ async def search_label(request: Request, query: str) -> OWLSearchResults:
 
     Requirements:
     - Query must be at least 2 characters long (limited to 1024 characters)
-    - Returns an empty list if no matches are found or query is too short/long
+    - An HTTP 422 error is returned if query length requirements are not met
+    - Returns an empty list if no matches are found
 
     Example response:
     ```json
     {
-      "results": [
-        [
-          {
-            "iri": "8H5wUAUQ0N9s4hHaF2cNO8k",
-            "label": "Contractual Agreement",
-            "definition": "A legally binding agreement between two or more parties.",
-            ...
-          },
-          0.95  // Relevance score
-        ],
-        [...]
-      ]
+      "classes": [
+        {
+          "iri": "8H5wUAUQ0N9s4hHaF2cNO8k",
+          "label": "Contractual Agreement",
+          "definition": "A legally binding agreement between two or more parties.",
+          ...
+        },
+        ...
+      ],
+      "scores": [0.95, ...]  // Relevance score per class
     }
     ```
 
-    Note: The results are returned as a list of tuples, each containing an OWLClass object
-    and a numeric relevance score between 0 and 1, with higher scores indicating better matches.
+    Note: The results are returned as parallel lists: `scores[i]` is the relevance score
+    (between 0 and 1, higher is better) of `classes[i]`.
     """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(results=folio.search_by_label(query))
+    return await _cached_search_response(
+        request, "label", _fuzzy_search_key(query), _render_label
+    )
 
 
 @router.get(
@@ -302,7 +604,7 @@ async def search_label(request: Request, query: str) -> OWLSearchResults:
     summary="Search by Definition Content",
     description="Find ontology classes whose definitions contain the given query string, with relevance scores",
 )
-async def search_definition(request: Request, query: str) -> OWLSearchResults:
+async def search_definition(request: Request, query: str = SEARCH_QUERY) -> Response:
     """
     Search for FOLIO ontology classes whose definitions contain the provided query string.
 
@@ -321,35 +623,31 @@ async def search_definition(request: Request, query: str) -> OWLSearchResults:
 
     Requirements:
     - Query must be at least 2 characters long (limited to 1024 characters)
-    - Returns an empty list if no matches are found or query is too short/long
+    - An HTTP 422 error is returned if query length requirements are not met
+    - Returns an empty list if no matches are found
 
     Example response:
     ```json
     {
-      "results": [
-        [
-          {
-            "iri": "rTn1gH6J3mLpOqZxS0uW9vY",
-            "label": "Real Property",
-            "definition": "Land and anything fixed, immovable, or permanently attached to it.",
-            ...
-          },
-          0.88  // Relevance score
-        ],
-        [...]
-      ]
+      "classes": [
+        {
+          "iri": "rTn1gH6J3mLpOqZxS0uW9vY",
+          "label": "Real Property",
+          "definition": "Land and anything fixed, immovable, or permanently attached to it.",
+          ...
+        },
+        ...
+      ],
+      "scores": [0.88, ...]  // Relevance score per class
     }
     ```
 
-    Note: The results are returned as a list of tuples, each containing an OWLClass object
-    and a numeric relevance score between 0 and 1, with higher scores indicating better matches.
+    Note: The results are returned as parallel lists: `scores[i]` is the relevance score
+    (between 0 and 1, higher is better) of `classes[i]`.
     """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(results=folio.search_by_definition(query))
+    return await _cached_search_response(
+        request, "definition", _fuzzy_search_key(query), _render_definition
+    )
 
 
 @router.get(
@@ -360,8 +658,8 @@ async def search_definition(request: Request, query: str) -> OWLSearchResults:
     description="Use LLM-based semantic search to find areas of law related to your query",
 )
 async def search_llm_area_of_law(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
+    request: Request, query: str = SEARCH_QUERY, max_depth: int = DEFAULT_MAX_DEPTH
+) -> Response:
     """
     Search for areas of law in the FOLIO ontology using AI-powered semantic search.
 
@@ -386,495 +684,77 @@ async def search_llm_area_of_law(
 
     Requirements:
     - Query must be at least 2 characters long (limited to 1024 characters)
-    - Returns an empty list if no matches are found or query is too short/long
+    - An HTTP 422 error is returned if query length requirements are not met
+    - Returns an empty list if no matches are found
 
     Example response:
     ```json
     {
-      "results": [
-        [
-          {
-            "iri": "uY5tR1zX9vB7nM3kL7jH5gF",
-            "label": "Landlord-Tenant Law",
-            "definition": "Body of law that governs rental properties and agreements.",
-            ...
-          },
-          0.92  // Relevance score
-        ],
-        [...]
-      ]
+      "classes": [
+        {
+          "iri": "uY5tR1zX9vB7nM3kL7jH5gF",
+          "label": "Landlord-Tenant Law",
+          "definition": "Body of law that governs rental properties and agreements.",
+          ...
+        },
+        ...
+      ],
+      "scores": [0.92, ...]  // Relevance score per class
     }
     ```
 
     Note: LLM-based search may take slightly longer than traditional keyword search
     but provides more semantically meaningful results.
     """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_areas_of_law(max_depth=max_depth)
-        )
-    )
-
-
-@router.get("/llm/asset-types", tags=["search"], response_model=OWLSearchResults)
-async def search_asset_types(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO asset types.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_asset_types(max_depth=max_depth)
-        )
-    )
-
-
-# communication modalities
-@router.get(
-    "/llm/communication-modalities", tags=["search"], response_model=OWLSearchResults
-)
-async def search_communication_modalities(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO communication modalities.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query,
-            search_set=folio.get_communication_modalities(max_depth=max_depth),
-        )
-    )
-
-
-# get currencies
-@router.get("/llm/currencies", tags=["search"], response_model=OWLSearchResults)
-async def search_currencies(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO currencies.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_currencies(max_depth=max_depth)
-        )
-    )
-
-
-# data formats
-@router.get("/llm/data-formats", tags=["search"], response_model=OWLSearchResults)
-async def search_data_formats(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO data formats.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_data_formats(max_depth=max_depth)
-        )
-    )
-
-
-# document artifacts
-@router.get("/llm/document-artifacts", tags=["search"], response_model=OWLSearchResults)
-async def search_document_artifacts(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO document artifacts.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_document_artifacts(max_depth=max_depth)
-        )
-    )
-
-
-# engagement terms
-@router.get("/llm/engagement-terms", tags=["search"], response_model=OWLSearchResults)
-async def search_engagement_terms(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO engagement terms.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_engagement_terms(max_depth=max_depth)
-        )
-    )
-
-
-# events
-@router.get("/llm/events", tags=["search"], response_model=OWLSearchResults)
-async def search_events(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO events.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_events(max_depth=max_depth)
-        )
-    )
-
-
-# governmental bodies
-@router.get(
-    "/llm/governmental-bodies", tags=["search"], response_model=OWLSearchResults
-)
-async def search_governmental_bodies(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO governmental bodies.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_governmental_bodies(max_depth=max_depth)
-        )
-    )
-
-
-# industries
-@router.get("/llm/industries", tags=["search"], response_model=OWLSearchResults)
-async def search_industries(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO industries.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_industries(max_depth=max_depth)
-        )
-    )
-
-
-# legal authorities
-@router.get("/llm/legal-authorities", tags=["search"], response_model=OWLSearchResults)
-async def search_legal_authorities(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO legal authorities.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_legal_authorities(max_depth=max_depth)
-        )
-    )
-
-
-# locations
-@router.get("/llm/locations", tags=["search"], response_model=OWLSearchResults)
-async def search_locations(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO locations.
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_locations(max_depth=max_depth)
-        )
-    )
-
-
-# matter narratives
-@router.get("/llm/matter-narratives", tags=["search"], response_model=OWLSearchResults)
-async def search_matter_narratives(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO matter narratives.
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_matter_narratives(max_depth=max_depth)
-        )
-    )
-
-
-# matter narrative formats
-@router.get(
-    "/llm/matter-narrative-formats", tags=["search"], response_model=OWLSearchResults
-)
-async def search_matter_narrative_formats(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO matter narrative formats.
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query,
-            search_set=folio.get_matter_narrative_formats(max_depth=max_depth),
-        )
-    )
-
-
-# objectives
-@router.get("/llm/objectives", tags=["search"], response_model=OWLSearchResults)
-async def search_objectives(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO objectives.
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_objectives(max_depth=max_depth)
-        )
-    )
-
-
-@router.get("/llm/player-actors", tags=["search"], response_model=OWLSearchResults)
-async def search_player_actors(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO player actors.
-
-    Args:
-        request (Request): FastAPI request object
-        query (str): Query string
-        max_depth (int): Maximum depth
-
-    Returns:
-        OWLClassList: Pydantic model with list of classes
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_player_actors(max_depth=max_depth)
-        )
-    )
-
-
-# standards compatibilities
-@router.get(
-    "/llm/standards-compatibilities", tags=["search"], response_model=OWLSearchResults
-)
-async def search_standards_compatibilities(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO standards compatibilities.
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query,
-            search_set=folio.get_standards_compatibilities(max_depth=max_depth),
-        )
-    )
-
-
-# statuses
-@router.get("/llm/statuses", tags=["search"], response_model=OWLSearchResults)
-async def search_statuses(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO statuses.
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_statuses(max_depth=max_depth)
-        )
-    )
-
-
-# system identifiers
-@router.get("/llm/system-identifiers", tags=["search"], response_model=OWLSearchResults)
-async def search_system_identifiers(
-    request: Request, query: str, max_depth: int = DEFAULT_MAX_DEPTH
-) -> OWLSearchResults:
-    """
-    Get class information using the FOLIO system identifiers.
-    """
-    # check query length
-    if not query_length_check(query):
-        return OWLClassList(classes=[])
-
-    folio: FOLIO = request.app.state.folio
-    return OWLSearchResults(
-        results=await folio.search_by_llm(
-            query=query, search_set=folio.get_system_identifiers(max_depth=max_depth)
-        )
+    return await _llm_search_response(request, query, "get_areas_of_law", max_depth)
+
+
+# The remaining LLM semantic-search endpoints differ only in their candidate
+# set: path slug -> FOLIO getter for the set. Routes are named search_<slug>,
+# which keeps their OpenAPI operation IDs stable.
+_LLM_SEARCH_SETS = {
+    "asset-types": "get_asset_types",
+    "communication-modalities": "get_communication_modalities",
+    "currencies": "get_currencies",
+    "data-formats": "get_data_formats",
+    "document-artifacts": "get_document_artifacts",
+    "engagement-terms": "get_engagement_terms",
+    "events": "get_events",
+    "governmental-bodies": "get_governmental_bodies",
+    "industries": "get_industries",
+    "legal-authorities": "get_legal_authorities",
+    "locations": "get_locations",
+    "matter-narratives": "get_matter_narratives",
+    "matter-narrative-formats": "get_matter_narrative_formats",
+    "objectives": "get_objectives",
+    "player-actors": "get_player_actors",
+    "standards-compatibilities": "get_standards_compatibilities",
+    "statuses": "get_statuses",
+    "system-identifiers": "get_system_identifiers",
+}
+
+
+def _llm_search_endpoint(getter: str) -> Callable[..., Awaitable[Response]]:
+    """Endpoint running an LLM search over ``folio.<getter>(max_depth)``."""
+
+    async def search(
+        request: Request, query: str = SEARCH_QUERY, max_depth: int = DEFAULT_MAX_DEPTH
+    ) -> Response:
+        return await _llm_search_response(request, query, getter, max_depth)
+
+    return search
+
+
+for _slug, _getter in _LLM_SEARCH_SETS.items():
+    _label = _slug.replace("-", " ")
+    router.add_api_route(
+        f"/llm/{_slug}",
+        _llm_search_endpoint(_getter),
+        methods=["GET"],
+        name="search_" + _slug.replace("-", "_"),
+        tags=["search"],
+        response_model=OWLSearchResults,
+        description=f"Get class information using the FOLIO {_label}.",
     )
 
 
@@ -903,7 +783,7 @@ async def query_concepts(
     country: str | None = None,
     match_mode: str = "substring",
     limit: int = 20,
-) -> OWLClassList:
+) -> Response:
     """Query FOLIO classes with composable text and structural filters.
 
     Text filters (all specified filters must match):
@@ -937,7 +817,7 @@ async def query_concepts(
         match_mode=match_mode,
         limit=limit,
     )
-    return OWLClassList(classes=results)
+    return class_list_response(request, results)
 
 
 @router.get(
@@ -957,7 +837,7 @@ async def query_properties(
     has_inverse: bool | None = None,
     match_mode: str = "substring",
     limit: int = 20,
-) -> OWLObjectPropertyList:
+) -> Response:
     """Query FOLIO object properties with composable text and structural filters.
 
     Text filters:
@@ -981,4 +861,4 @@ async def query_properties(
         match_mode=match_mode,
         limit=limit,
     )
-    return OWLObjectPropertyList(properties=results)
+    return property_list_response(request, results)
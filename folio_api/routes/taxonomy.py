@@ -3,16 +3,21 @@ Taxonomy routes for the FOLIO API.
 """
 
 # imports
-from pathlib import Path
 
 # packages
 from fastapi import APIRouter, Request, status
 from folio import FOLIO, FOLIO_TYPE_IRIS
-from starlette.responses import Response, JSONResponse, RedirectResponse
+from starlette.responses import Response, RedirectResponse
 
 # project
 from folio_api.models import OWLClassList
-from folio_api.rendering import get_node_neighbors, strip_folio_prefix
+from folio_api.rendering import (
+    get_node_neighbors,
+    strip_folio_prefix,
+    typeahead_js_source,
+)
+from folio_api.responses import ORJSONResponse
+from folio_api.serialization import class_list_stream_response
 
 # API router
 router = APIRouter(prefix="/taxonomy", tags=["taxonomy"])
@@ -94,7 +99,7 @@ ROOT_CLASS_IRI_IDS = [
         },
     },
 )
-async def get_actor_player(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_actor_player(request: Request, max_depth: int = 1) -> Response:
     """
     Retrieve all classes of type 'Actor Player' from the FOLIO ontology.
 
@@ -144,7 +149,9 @@ async def get_actor_player(request: Request, max_depth: int = 1) -> OWLClassList
     # If max_depth is not an integer, FastAPI will return a 422 Unprocessable Entity error
 
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_player_actors(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_player_actors(max_depth=max_depth)
+    )
 
 
 @router.get(
@@ -154,7 +161,7 @@ async def get_actor_player(request: Request, max_depth: int = 1) -> OWLClassList
     summary="Get Area of Law Classes",
     description="Retrieve all Area of Law classes from the FOLIO ontology with optional traversal depth",
 )
-async def get_area_of_law(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_area_of_law(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Area of Law.
 
@@ -166,11 +173,13 @@ async def get_area_of_law(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_areas_of_law(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_areas_of_law(max_depth=max_depth)
+    )
 
 
 @router.get("/asset_type", tags=["taxonomy"], response_model=OWLClassList)
-async def get_asset_type(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_asset_type(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Asset Type.
 
@@ -182,13 +191,15 @@ async def get_asset_type(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_asset_types(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_asset_types(max_depth=max_depth)
+    )
 
 
 @router.get("/communication_modality", tags=["taxonomy"], response_model=OWLClassList)
 async def get_communication_modality(
     request: Request, max_depth: int = 1
-) -> OWLClassList:
+) -> Response:
     """
     Get all classes of type Communication Modality.
 
@@ -200,11 +211,13 @@ async def get_communication_modality(
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_communication_modalities(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_communication_modalities(max_depth=max_depth)
+    )
 
 
 @router.get("/currency", tags=["taxonomy"], response_model=OWLClassList)
-async def get_currency(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_currency(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Currency.
 
@@ -216,11 +229,13 @@ async def get_currency(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_currencies(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_currencies(max_depth=max_depth)
+    )
 
 
 @router.get("/data_format", tags=["taxonomy"], response_model=OWLClassList)
-async def get_data_format(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_data_format(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Data Format.
 
@@ -232,11 +247,13 @@ async def get_data_format(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_data_formats(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_data_formats(max_depth=max_depth)
+    )
 
 
 @router.get("/document_artifact", tags=["taxonomy"], response_model=OWLClassList)
-async def get_document_artifact(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_document_artifact(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Document Artifact.
 
@@ -248,11 +265,13 @@ async def get_document_artifact(request: Request, max_depth: int = 1) -> OWLClas
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_document_artifacts(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_document_artifacts(max_depth=max_depth)
+    )
 
 
 @router.get("/engagement_terms", tags=["taxonomy"], response_model=OWLClassList)
-async def get_engagement_terms(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_engagement_terms(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Engagement Terms.
 
@@ -264,11 +283,13 @@ async def get_engagement_terms(request: Request, max_depth: int = 1) -> OWLClass
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_engagement_terms(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_engagement_terms(max_depth=max_depth)
+    )
 
 
 @router.get("/event", tags=["taxonomy"], response_model=OWLClassList)
-async def get_event(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_event(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Event.
 
@@ -280,11 +301,11 @@ async def get_event(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_events(max_depth=max_depth))
+    return class_list_stream_response(request, folio.get_events(max_depth=max_depth))
 
 
 @router.get("/forums_venues", tags=["taxonomy"], response_model=OWLClassList)
-async def get_forums_venues(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_forums_venues(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Forums Venues.
 
@@ -296,11 +317,13 @@ async def get_forums_venues(request: Request, max_depth: int = 1) -> OWLClassLis
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_forum_venues(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_forum_venues(max_depth=max_depth)
+    )
 
 
 @router.get("/governmental_body", tags=["taxonomy"], response_model=OWLClassList)
-async def get_governmental_body(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_governmental_body(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Governmental Body.
 
@@ -312,11 +335,13 @@ async def get_governmental_body(request: Request, max_depth: int = 1) -> OWLClas
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_governmental_bodies(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_governmental_bodies(max_depth=max_depth)
+    )
 
 
 @router.get("/industry", tags=["taxonomy"], response_model=OWLClassList)
-async def get_industry(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_industry(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Industry.
 
@@ -328,11 +353,13 @@ async def get_industry(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_industries(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_industries(max_depth=max_depth)
+    )
 
 
 @router.get("/language", tags=["taxonomy"], response_model=OWLClassList)
-async def get_language(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_language(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Language.
 
@@ -344,11 +371,11 @@ async def get_language(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_languages(max_depth=max_depth))
+    return class_list_stream_response(request, folio.get_languages(max_depth=max_depth))
 
 
 @router.get("/legal_authorities", tags=["taxonomy"], response_model=OWLClassList)
-async def get_legal_authorities(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_legal_authorities(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Legal Authorities.
 
@@ -360,11 +387,13 @@ async def get_legal_authorities(request: Request, max_depth: int = 1) -> OWLClas
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_legal_authorities(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_legal_authorities(max_depth=max_depth)
+    )
 
 
 @router.get("/legal_entity", tags=["taxonomy"], response_model=OWLClassList)
-async def get_legal_entity(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_legal_entity(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Legal Entity.
 
@@ -376,11 +405,13 @@ async def get_legal_entity(request: Request, max_depth: int = 1) -> OWLClassList
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_legal_entities(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_legal_entities(max_depth=max_depth)
+    )
 
 
 @router.get("/location", tags=["taxonomy"], response_model=OWLClassList)
-async def get_location(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_location(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Location.
 
@@ -392,11 +423,11 @@ async def get_location(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_locations(max_depth=max_depth))
+    return class_list_stream_response(request, folio.get_locations(max_depth=max_depth))
 
 
 @router.get("/matter_narrative", tags=["taxonomy"], response_model=OWLClassList)
-async def get_matter_narrative(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_matter_narrative(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Matter Narrative.
 
@@ -408,13 +439,15 @@ async def get_matter_narrative(request: Request, max_depth: int = 1) -> OWLClass
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_matter_narratives(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_matter_narratives(max_depth=max_depth)
+    )
 
 
 @router.get("/matter_narrative_format", tags=["taxonomy"], response_model=OWLClassList)
 async def get_matter_narrative_format(
     request: Request, max_depth: int = 1
-) -> OWLClassList:
+) -> Response:
     """
     Get all classes of type Matter Narrative Format.
 
@@ -426,11 +459,13 @@ async def get_matter_narrative_format(
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_matter_narrative_formats(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_matter_narrative_formats(max_depth=max_depth)
+    )
 
 
 @router.get("/objectives", tags=["taxonomy"], response_model=OWLClassList)
-async def get_objectives(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_objectives(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Objectives.
 
@@ -442,11 +477,13 @@ async def get_objectives(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_objectives(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_objectives(max_depth=max_depth)
+    )
 
 
 @router.get("/service", tags=["taxonomy"], response_model=OWLClassList)
-async def get_service(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_service(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Service.
 
@@ -458,13 +495,13 @@ async def get_service(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_services(max_depth=max_depth))
+    return class_list_stream_response(request, folio.get_services(max_depth=max_depth))
 
 
 @router.get("/standards_compatibility", tags=["taxonomy"], response_model=OWLClassList)
 async def get_standards_compatibility(
     request: Request, max_depth: int = 1
-) -> OWLClassList:
+) -> Response:
     """
     Get all classes of type Standards Compatibility.
 
@@ -476,13 +513,13 @@ async def get_standards_compatibility(
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(
-        classes=folio.get_standards_compatibilities(max_depth=max_depth)
+    return class_list_stream_response(
+        request, folio.get_standards_compatibilities(max_depth=max_depth)
     )
 
 
 @router.get("/status", tags=["taxonomy"], response_model=OWLClassList)
-async def get_status(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_status(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type Status.
 
@@ -494,11 +531,11 @@ async def get_status(request: Request, max_depth: int = 1) -> OWLClassList:
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_statuses(max_depth=max_depth))
+    return class_list_stream_response(request, folio.get_statuses(max_depth=max_depth))
 
 
 @router.get("/system_identifiers", tags=["taxonomy"], response_model=OWLClassList)
-async def get_system_identifiers(request: Request, max_depth: int = 1) -> OWLClassList:
+async def get_system_identifiers(request: Request, max_depth: int = 1) -> Response:
     """
     Get all classes of type System Identifiers.
 
@@ -510,7 +547,9 @@ async def get_system_identifiers(request: Request, max_depth: int = 1) -> OWLCla
         OWLClassList: Pydantic model with list of OWLClass objects
     """
     folio: FOLIO = request.app.state.folio
-    return OWLClassList(classes=folio.get_system_identifiers(max_depth=max_depth))
+    return class_list_stream_response(
+        request, folio.get_system_identifiers(max_depth=max_depth)
+    )
 
 
 @router.get(
@@ -521,7 +560,7 @@ async def get_system_identifiers(request: Request, max_depth: int = 1) -> OWLCla
     description="List all 24 taxonomy branches with concept counts",
     status_code=status.HTTP_200_OK,
 )
-async def list_branches(request: Request) -> JSONResponse:
+async def list_branches(request: Request) -> ORJSONResponse:
     """List all taxonomy branches with their concept counts.
 
     Returns a JSON object mapping branch names to concept counts.
@@ -564,7 +603,7 @@ async def list_branches(request: Request) -> JSONResponse:
             result[branch_name] = len(concepts)
         else:
             result[branch_name] = 0
-    return JSONResponse(content=result)
+    return ORJSONResponse(content=result)
 
 
 @router.get(
@@ -577,7 +616,7 @@ async def list_branches(request: Request) -> JSONResponse:
 )
 async def get_tree_data(
     request: Request, node_id: str = "#", max_depth: int = 1
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get hierarchical data for the taxonomy tree in a format compatible with jsTree.
 
@@ -591,7 +630,7 @@ async def get_tree_data(
         max_depth (int): Maximum depth to traverse when getting children
 
     Returns:
-        JSONResponse: A list of nodes in jsTree format
+        ORJSONResponse: A list of nodes in jsTree format
     """
     folio: FOLIO = request.app.state.folio
 
@@ -626,13 +665,13 @@ async def get_tree_data(
         # Sort root level nodes alphabetically by label
         result.sort(key=lambda x: x["text"].lower())
 
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
 
     # If requesting children of a specific node
     else:
         owl_class = folio[node_id]
         if not owl_class:
-            return JSONResponse(content=[])
+            return ORJSONResponse(content=[])
 
         # Get children of this class
         children = []
@@ -658,7 +697,7 @@ async def get_tree_data(
         # Sort child nodes alphabetically by label
         children.sort(key=lambda x: x["text"].lower())
 
-        return JSONResponse(content=children)
+        return ORJSONResponse(content=children)
 
 
 @router.get(
@@ -669,7 +708,7 @@ async def get_tree_data(
     description="Get detailed data for a single taxonomy node",
     status_code=status.HTTP_200_OK,
 )
-async def get_node_data(request: Request, iri: str) -> JSONResponse:
+async def get_node_data(request: Request, iri: str) -> ORJSONResponse:
     """
     Get detailed data for a single taxonomy node by IRI.
 
@@ -678,7 +717,7 @@ async def get_node_data(request: Request, iri: str) -> JSONResponse:
         iri (str): The IRI of the node to get data for
 
     Returns:
-        JSONResponse: Detailed information about the node
+        ORJSONResponse: Detailed information about the node
     """
     folio: FOLIO = request.app.state.folio
 
@@ -710,7 +749,7 @@ async def get_node_data(request: Request, iri: str) -> JSONResponse:
                 break
 
     if not owl_class:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": f"Class not found for identifier: {iri}"},
             status_code=status.HTTP_404_NOT_FOUND,
         )
@@ -819,7 +858,7 @@ async def get_node_data(request: Request, iri: str) -> JSONResponse:
         "edges": edges,
     }
 
-    return JSONResponse(content=result)
+    return ORJSONResponse(content=result)
 
 
 @router.get(
@@ -830,7 +869,7 @@ async def get_node_data(request: Request, iri: str) -> JSONResponse:
     description="Get the complete path from root to a specific node in the taxonomy tree",
     status_code=status.HTTP_200_OK,
 )
-async def get_path_to_node(request: Request, iri: str) -> JSONResponse:
+async def get_path_to_node(request: Request, iri: str) -> ORJSONResponse:
     """
     Get the complete path from root to a specific node in the taxonomy tree.
 
@@ -843,7 +882,7 @@ async def get_path_to_node(request: Request, iri: str) -> JSONResponse:
         iri (str): The IRI of the node to find the path for
 
     Returns:
-        JSONResponse: An array of nodes representing the path from root to the target node
+        ORJSONResponse: An array of nodes representing the path from root to the target node
     """
     folio: FOLIO = request.app.state.folio
 
@@ -875,7 +914,7 @@ async def get_path_to_node(request: Request, iri: str) -> JSONResponse:
                 break
 
     if not owl_class:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": f"Class not found for identifier: {iri}"},
             status_code=status.HTTP_404_NOT_FOUND,
         )
@@ -924,7 +963,7 @@ async def get_path_to_node(request: Request, iri: str) -> JSONResponse:
             # If parent not found, stop traversal
             break
 
-    return JSONResponse(content={"path": path})
+    return ORJSONResponse(content={"path": path})
 
 
 @router.get(
@@ -935,7 +974,7 @@ async def get_path_to_node(request: Request, iri: str) -> JSONResponse:
     description="Search for classes and return a filtered tree structure containing only matches and their ancestors",
     status_code=status.HTTP_200_OK,
 )
-async def search_taxonomy_tree(request: Request, query: str) -> JSONResponse:
+async def search_taxonomy_tree(request: Request, query: str) -> ORJSONResponse:
     """
     Search for classes in the taxonomy and return a filtered tree structure.
 
@@ -951,7 +990,7 @@ async def search_taxonomy_tree(request: Request, query: str) -> JSONResponse:
         query (str): The search query string
 
     Returns:
-        JSONResponse: A filtered tree structure containing only matching classes and their ancestors
+        ORJSONResponse: A filtered tree structure containing only matching classes and their ancestors
     """
     folio: FOLIO = request.app.state.folio
 
@@ -1047,7 +1086,7 @@ async def search_taxonomy_tree(request: Request, query: str) -> JSONResponse:
 
     # Process search results
     if not search_results:
-        return JSONResponse(content={"matches": [], "tree": {}})
+        return ORJSONResponse(content={"matches": [], "tree": {}})
 
     # Now build the filtered tree structure
     # We'll keep track of all nodes (classes) that should be in the tree
@@ -1163,7 +1202,7 @@ async def search_taxonomy_tree(request: Request, query: str) -> JSONResponse:
     tree["root_nodes"] = [x[0] for x in root_nodes_with_labels]
     
     # Return the search matches and filtered tree structure
-    return JSONResponse(content={"matches": matches, "tree": tree})
+    return ORJSONResponse(content={"matches": matches, "tree": tree})
 
 
 @router.get(
@@ -1389,19 +1428,13 @@ async def browse_top_level_classes(request: Request) -> Response:
     # Sort root classes alphabetically by label
     root_classes.sort(key=lambda x: x.label.lower() if x.label else "")
 
-    # Import JavaScript for typeahead search
-    typeahead_js_path = (
-        Path(__file__).parent.parent / "static" / "js" / "typeahead_search.js"
-    )
-    typeahead_js_source = typeahead_js_path.read_text(encoding="utf-8")
-
     # Render template
     return request.app.state.templates.TemplateResponse(
         "taxonomy/browse.html",
         {
             "request": request,
             "root_classes": root_classes,
-            "typeahead_js_source": typeahead_js_source,
+            "typeahead_js_source": typeahead_js_source(),
             "config": request.app.state.config,
         },
     )
@@ -0,0 +1,231 @@
+"""
+Pre-serialized JSON for FOLIO ontology entities.
+
+The ontology is immutable for the lifetime of the process, so every OWLClass
+and OWLObjectProperty is serialized to JSON bytes once (warmed at startup,
+filled lazily for anything missed) and list/search response bodies are
+assembled by joining the cached fragments instead of re-validating and
+re-encoding the same models on every request.
+
+Routes return these bodies as a ``Response``; FastAPI passes a returned
+``Response`` through untouched, so the ``response_model`` on such a route only
+documents the schema and never runs validation or ``jsonable_encoder``.
+"""
+
+# Standard library imports
+import hashlib
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+# Third-party imports
+import orjson
+from fastapi import Request
+from folio import OWLClass, OWLObjectProperty
+from starlette.responses import Response, StreamingResponse
+
+OWLEntity = Union[OWLClass, OWLObjectProperty]
+
+# Target size of each chunk written by streamed list responses.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bodies of empty list/search responses. Returned as shared constants so the
+# many cached no-match searches all point at one object.
+EMPTY_ARRAY = b"[]"
+EMPTY_CLASS_LIST = b'{"classes":[],"properties":[]}'
+EMPTY_SEARCH_RESULTS = b'{"classes":[],"scores":[]}'
+
+
+class ClassJSONCache:
+    """
+    IRI-keyed cache of entity JSON fragments.
+
+    Holds both classes and object properties (their IRIs never collide). The
+    assembled bodies match what FastAPI would emit for the corresponding
+    ``OWLClassList`` / ``OWLObjectPropertyList`` / ``OWLSearchResults``
+    response models.
+
+    With ``exclude_none`` the fragments leave out fields that are ``None``
+    instead of serializing them as ``null``; sparsely populated classes shrink
+    considerably and the bodies still validate against the same models.
+    """
+
+    def __init__(self, exclude_none: bool = False) -> None:
+        self.exclude_none = exclude_none
+        self._fragments: Dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def warm(self, entities: Iterable[OWLEntity]) -> None:
+        """
+        Serialize ``entities`` up front so requests only ever hit the cache.
+
+        Args:
+            entities: OWLClass / OWLObjectProperty objects to cache
+        """
+        for entity in entities:
+            self._fragments[entity.iri] = self._dump(entity)
+
+    def content_digest(self) -> str:
+        """
+        Hex digest over every cached fragment, in insertion order.
+
+        Any edit to a label, definition or other field of a warmed entity
+        changes it, so it can key validators for responses built from them.
+        """
+        digest = hashlib.blake2b(digest_size=12)
+        for iri, fragment in self._fragments.items():
+            digest.update(iri.encode("utf-8"))
+            digest.update(b"\x00")
+            digest.update(fragment)
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _dump(self, entity: OWLEntity) -> bytes:
+        """Serialize one entity to JSON bytes."""
+        return entity.model_dump_json(exclude_none=self.exclude_none).encode("utf-8")
+
+    def fragment(self, entity: OWLEntity) -> bytes:
+        """
+        Return the cached JSON bytes for one entity, serializing on a miss.
+
+        Args:
+            entity: OWLClass or OWLObjectProperty
+
+        Returns:
+            bytes: The entity's JSON object
+        """
+        try:
+            return self._fragments[entity.iri]
+        except KeyError:
+            data = self._dump(entity)
+            self._fragments[entity.iri] = data
+            return data
+
+    def array(self, entities: Iterable[OWLEntity]) -> bytes:
+        """JSON array of the given entities."""
+        return b"[" + b",".join(self.fragment(entity) for entity in entities) + b"]"
+
+    def mapping(self, items: Iterable[Tuple[str, OWLEntity]]) -> bytes:
+        """JSON object mapping each key to its entity, from ``(key, entity)`` pairs."""
+        return (
+            b"{"
+            + b",".join(
+                orjson.dumps(key) + b":" + self.fragment(entity)
+                for key, entity in items
+            )
+            + b"}"
+        )
+
+    def property_list(self, properties: Iterable[OWLObjectProperty]) -> bytes:
+        """Body of an ``OWLObjectPropertyList`` response."""
+        return b'{"properties":' + self.array(properties) + b"}"
+
+    def class_list(
+        self,
+        classes: Iterable[OWLClass],
+        properties: Iterable[OWLObjectProperty] = (),
+    ) -> bytes:
+        """Body of an ``OWLClassList`` response."""
+        classes_json = self.array(classes)
+        properties_json = self.array(properties)
+        if classes_json == EMPTY_ARRAY and properties_json == EMPTY_ARRAY:
+            return EMPTY_CLASS_LIST
+        return (
+            b'{"classes":' + classes_json + b',"properties":' + properties_json + b"}"
+        )
+
+    def iter_class_list(
+        self,
+        classes: Iterable[OWLClass],
+        properties: Iterable[OWLObjectProperty] = (),
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Yield an ``OWLClassList`` body in chunks of roughly ``chunk_size`` bytes.
+
+        Fragments are batched so a large branch is sent in a handful of writes
+        rather than one ASGI message per class.
+        """
+        buffer = bytearray(b'{"classes":[')
+        for key, entities in ((b"", classes), (b'],"properties":[', properties)):
+            buffer += key
+            first = True
+            for entity in entities:
+                if not first:
+                    buffer += b","
+                first = False
+                buffer += self.fragment(entity)
+                if len(buffer) >= chunk_size:
+                    yield bytes(buffer)
+                    buffer.clear()
+        buffer += b"]}"
+        yield bytes(buffer)
+
+    def search_results(
+        self, hits: Iterable[Tuple[OWLClass, Union[int, float]]]
+    ) -> bytes:
+        """Body of an ``OWLSearchResults`` response from ``(class, score)`` hits."""
+        fragments = []
+        scores = []
+        for owl_class, score in hits:
+            fragments.append(self.fragment(owl_class))
+            scores.append(float(score))
+        if not fragments:
+            return EMPTY_SEARCH_RESULTS
+        return (
+            b'{"classes":['
+            + b",".join(fragments)
+            + b'],"scores":'
+            + orjson.dumps(scores)
+            + b"}"
+        )
+
+
+def json_bytes_response(
+    body: bytes, status_code: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """Wrap an already-encoded JSON body in a response without re-encoding it."""
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def class_list_response(
+    request: Request,
+    classes: Iterable[OWLClass],
+    properties: Iterable[OWLObjectProperty] = (),
+) -> Response:
+    """``OWLClassList`` response built from the app's cached entity JSON."""
+    cache: ClassJSONCache = request.app.state.class_json
+    return json_bytes_response(cache.class_list(classes, properties))
+
+
+def class_list_stream_response(
+    request: Request,
+    classes: Iterable[OWLClass],
+    properties: Iterable[OWLObjectProperty] = (),
+) -> StreamingResponse:
+    """Chunked ``OWLClassList`` response for large class lists (taxonomy branches)."""
+    cache: ClassJSONCache = request.app.state.class_json
+    return StreamingResponse(
+        cache.iter_class_list(classes, properties), media_type="application/json"
+    )
+
+
+def property_list_response(
+    request: Request, properties: Iterable[OWLObjectProperty]
+) -> Response:
+    """``OWLObjectPropertyList`` response built from the app's cached entity JSON."""
+    cache: ClassJSONCache = request.app.state.class_json
+    return json_bytes_response(cache.property_list(properties))
+
+
+def search_results_response(
+    request: Request, hits: Iterable[Tuple[OWLClass, Union[int, float]]]
+) -> Response:
+    """``OWLSearchResults`` response built from the app's cached entity JSON."""
+    cache: ClassJSONCache = request.app.state.class_json
+    return json_bytes_response(cache.search_results(hits))
@@ -5,7 +5,7 @@ Two fixtures:
     on entry, so `app.state.folio` and `app.state.property_children` are
     populated for every test that uses it. Function-scoped so each test
     gets a fresh client (the underlying app + ontology are session-scoped
-    through Python module caching, so this is cheap).
+    through the `_booted_app` fixture, so this is cheap).
   - `folio`: a session-scoped reference to `app.state.folio` (the in-memory
     ontology). Tests use this directly when they don't need an HTTP round
     trip.
@@ -14,7 +14,7 @@ Two fixtures:
 import pytest
 from fastapi.testclient import TestClient
 
-from folio_api.api import app
+from folio_api.api import get_app
 
 
 @pytest.fixture(scope="session")
@@ -26,6 +26,7 @@ def _booted_app():
     # Using TestClient as a context manager triggers the lifespan
     # startup and shutdown events. We only need startup here, so we
     # enter the context and hold it open for the whole session.
+    app = get_app()
     with TestClient(app) as _:
         yield app
 
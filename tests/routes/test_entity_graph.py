@@ -225,3 +225,14 @@ def test_invalid_mode_rejected(client, folio):
     cls = _pick_class_with_ancestors(folio, min_depth=1)
     resp = client.get(f"/explore/api/entity-graph/{quote(cls.iri, safe='')}?mode=foobar")
     assert resp.status_code == 422
+
+
+def test_entity_graph_payload_is_encoded_once(client, folio):
+    from folio_api.routes.explore import _graph_payload_cache
+
+    target = _pick_class_with_ancestors(folio)
+    path = f"/explore/api/entity-graph/{quote(target.iri, safe='')}"
+    first = client.get(path)
+    assert first.status_code == 200
+    assert _graph_payload_cache[folio][(target.iri, "ancestors")] == first.content
+    assert client.get(path).content == first.content
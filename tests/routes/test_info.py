@@ -0,0 +1,40 @@
+"""Unit tests for the /info routes in folio_api/routes/info.py.
+
+Uses the session-scoped `folio` fixture and the function-scoped `client`
+fixture from tests/conftest.py; the payload-shape test uses a stand-in graph.
+"""
+
+from folio_api.models import HealthResponse
+from folio_api.routes.info import health_json
+
+
+class _FakeGraph:
+    object_properties = [object(), object()]
+    title = "FOLIO"
+    description = "Federated Open Legal Information Ontology"
+    source_type = "github"
+    http_url = None
+    github_repo_owner = "alea-institute"
+    github_repo_name = "folio"
+    github_repo_branch = "2.0.0"
+
+    def __len__(self):
+        return 3
+
+
+def test_health_payload_validates_against_model():
+    # health_json skips validation (model_construct), so check the encoded
+    # bytes still satisfy the documented response model
+    payload = HealthResponse.model_validate_json(health_json(_FakeGraph()))
+    assert payload.status == "healthy"
+    assert payload.folio_graph.num_classes == 3
+    assert payload.folio_graph.num_properties == 2
+
+
+def test_health_serves_prebuilt_payload(client, folio):
+    response = client.get("/info/health")
+    assert response.status_code == 200
+    assert response.content == health_json(folio)
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert body["folio_graph"]["num_classes"] == len(folio)
@@ -0,0 +1,191 @@
+"""Unit tests for the IRI resolution routes in folio_api/routes/root.py.
+
+Uses the session-scoped `folio` fixture and the function-scoped `client`
+fixture from tests/conftest.py. Targets are picked at runtime (the first
+labelled class / first property) so the suite survives ontology updates.
+Resolver memoization is checked against a counting stand-in graph.
+"""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from folio_api.models import OWLClassBatchRequest
+from folio_api.models.owl import MAX_IRI_LENGTH
+from folio_api.routes.root import _resolve_batch, _resolve_cache, _resolve_iri
+
+UNKNOWN_IRI = "RNoSuchEntityInTheFolioOntology"
+
+
+def _first_class(folio):
+    return next(cls for cls in folio.classes if cls.label)
+
+
+def _last_segment(iri: str) -> str:
+    return iri.rstrip("/").rsplit("/", 1)[-1]
+
+
+def test_bare_and_prefixed_ids_resolve_alike(client, folio):
+    segment = _last_segment(_first_class(folio).iri)
+    by_id = client.get(f"/{segment}")
+    by_prefix = client.get(f"/folio:{segment}")
+    assert by_id.status_code == by_prefix.status_code == 200
+    assert by_id.content == by_prefix.content
+
+
+def test_get_class_matches_model(client, folio):
+    owl_class = _first_class(folio)
+    response = client.get(f"/{_last_segment(owl_class.iri)}")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == json.loads(owl_class.model_dump_json())
+
+
+def test_get_property_returns_property_fields(client, folio):
+    prop = folio.object_properties[0]
+    response = client.get(f"/{_last_segment(prop.iri)}")
+    assert response.status_code == 200
+    assert response.json() == json.loads(prop.model_dump_json())
+
+
+def test_get_class_unknown_iri_returns_404(client):
+    response = client.get(f"/{UNKNOWN_IRI}")
+    assert response.status_code == 404
+    assert response.json() == {"message": "Entity not found."}
+
+
+def test_every_format_404s_with_a_fixed_body(client):
+    for suffix in ("jsonld", "xml", "html"):
+        response = client.get(f"/{UNKNOWN_IRI}/{suffix}")
+        assert response.status_code == 404
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"message": "Entity not found."}
+
+    response = client.get(f"/{UNKNOWN_IRI}/markdown")
+    assert response.status_code == 404
+    assert response.text == "Entity not found."
+
+
+def test_representations_are_rendered_once(client, folio):
+    owl_class = _first_class(folio)
+    path = f"/{_last_segment(owl_class.iri)}/markdown"
+    first = client.get(path)
+    assert first.status_code == 200
+    assert first.text == owl_class.to_markdown()
+
+    representations = client.app.state.representations
+    assert representations.get("markdown", owl_class.iri) == first.content
+    assert client.get(path).content == first.content
+
+
+def test_cache_clear_is_disabled_by_default(client):
+    assert client.post("/admin/cache/clear").status_code == 404
+
+
+def test_representations_revalidate_with_the_build_etag(client, folio):
+    segment = _last_segment(_first_class(folio).iri)
+    for path in (f"/{segment}", f"/{segment}/markdown", f"/{segment}/xml"):
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        assert "max-age=3600" in response.headers["cache-control"]
+
+        revalidated = client.get(path, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+
+def test_stale_etag_gets_full_response(client, folio):
+    segment = _last_segment(_first_class(folio).iri)
+    response = client.get(f"/{segment}/jsonld", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.content
+
+
+def test_large_representations_are_served_pregzipped(client, folio):
+    owl_class = _first_class(folio)
+    response = client.get(
+        f"/{_last_segment(owl_class.iri)}/html",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    representations = client.app.state.representations
+    assert response.content == representations.get("html", owl_class.iri)
+
+
+def test_class_xml_matches_to_owl_xml(client, folio):
+    owl_class = _first_class(folio)
+    response = client.get(f"/{_last_segment(owl_class.iri)}/xml")
+    assert response.status_code == 200
+    assert response.text == owl_class.to_owl_xml()
+
+
+class _Entity:
+    def __init__(self, iri):
+        self.iri = iri
+
+
+class _CountingGraph:
+    """Graph stand-in with no entities that counts every lookup."""
+
+    classes = []
+    object_properties = []
+    normalize_iri = staticmethod(lambda iri: iri)
+
+    def __init__(self):
+        self.lookups = 0
+
+    def __getitem__(self, iri):
+        self.lookups += 1
+        return None
+
+    def get_property(self, iri):
+        self.lookups += 1
+        return None
+
+
+def test_unresolved_iris_are_memoized():
+    graph = _CountingGraph()
+    assert _resolve_iri(graph, "wp-login.php") == (None, None)
+    lookups = graph.lookups
+    assert _resolve_iri(graph, "wp-login.php") == (None, None)
+    assert graph.lookups == lookups
+
+
+def test_batch_misses_are_not_memoized():
+    graph = _CountingGraph()
+    assert _resolve_batch(graph, ["wp-login.php", "wp-login.php"]) == {}
+    assert "wp-login.php" not in _resolve_cache.get(graph, {})
+
+
+def test_batch_classes_match_single_lookups(client, folio):
+    owl_class = _first_class(folio)
+    segment = _last_segment(owl_class.iri)
+    response = client.post("/classes", json={"iris": [segment, UNKNOWN_IRI]})
+    assert response.status_code == 200
+    assert response.json() == {segment: client.get(f"/{segment}").json()}
+
+
+def test_batch_classes_rejects_oversized_batches(client):
+    response = client.post("/classes", json={"iris": ["R"] * 501})
+    assert response.status_code == 422
+
+
+def test_batch_request_rejects_empty_and_overlong_iris():
+    # "" would suffix-match the first class
+    with pytest.raises(ValidationError):
+        OWLClassBatchRequest(iris=[""])
+    with pytest.raises(ValidationError):
+        OWLClassBatchRequest(iris=["R" * (MAX_IRI_LENGTH + 1)])
+
+
+def test_batch_skips_the_suffix_scan():
+    graph = _CountingGraph()
+    graph.classes = [_Entity("https://folio.openlegalstandard.org/RLease")]
+    assert _resolve_batch(graph, ["Lease"]) == {}
+    assert _resolve_iri(graph, "Lease") == (graph.classes[0], "class")
@@ -0,0 +1,300 @@
+"""Unit tests for the search caches in folio_api/routes/search.py.
+
+Self-contained: a stand-in graph counts how often each search runs, so no
+ontology load is needed.
+"""
+
+from fastapi.testclient import TestClient
+from folio import FOLIO, OWLClass
+
+from folio_api.api import get_app
+from folio_api.representation_cache import RepresentationCache
+from folio_api.routes.search import (
+    _definition_indexes,
+    _label_index,
+    _label_indexes,
+    _memoized_search,
+    _memoized_search_set,
+    _packed_matches,
+    _prefix_matches,
+    _search_by_definition,
+    clear_search_cache,
+    warm_search_indexes,
+    warm_search_sets,
+)
+from folio_api.serialization import ClassJSONCache
+
+
+class _CountingGraph:
+    def __init__(self):
+        self.calls = []
+
+    def search_by_label(self, query):
+        self.calls.append(query)
+        return [(query, 1.0)]
+
+
+def test_repeated_queries_hit_the_memo():
+    graph = _CountingGraph()
+    first = _memoized_search(graph, "search_by_label", "lease")
+    assert _memoized_search(graph, "search_by_label", "lease") is first
+    assert graph.calls == ["lease"]
+
+    _memoized_search(graph, "search_by_label", "lessor")
+    assert graph.calls == ["lease", "lessor"]
+
+
+def test_memo_is_per_graph_and_clearable():
+    graph, other = _CountingGraph(), _CountingGraph()
+    _memoized_search(graph, "search_by_label", "lease")
+    _memoized_search(other, "search_by_label", "lease")
+    assert other.calls == ["lease"]
+
+    clear_search_cache()
+    _memoized_search(graph, "search_by_label", "lease")
+    assert graph.calls == ["lease", "lease"]
+
+
+LEASE = OWLClass(iri="https://folio.openlegalstandard.org/RLease", label="Lease")
+
+
+class _SearchGraph(_CountingGraph):
+    classes = [LEASE]
+    object_properties = []
+
+    def search_by_label(self, query):
+        self.calls.append(query)
+        return [(LEASE, 0.9)]
+
+    def search_by_prefix(self, query):
+        # folio-python matches label prefixes case-insensitively
+        self.calls.append(query)
+        return [LEASE] if LEASE.label.casefold().startswith(query.casefold()) else []
+
+
+def _client(graph):
+    app = get_app()
+    app.state.folio = graph
+    app.state.class_json = ClassJSONCache()
+    app.state.search_responses = RepresentationCache()
+    app.state.entity_etag = 'W/"build"'
+    return TestClient(app)
+
+
+def test_search_bodies_are_cached_per_query():
+    graph = _SearchGraph()
+    client = _client(graph)
+    first = client.get("/search/label", params={"query": "Lea"})
+    assert first.status_code == 200
+    assert first.json()["scores"] == [0.9]
+    assert client.get("/search/label", params={"query": "Lea"}).content == first.content
+    assert graph.calls == ["lea"]
+
+    prefix = client.get("/search/prefix", params={"query": "Lea"})
+    assert [c["iri"] for c in prefix.json()["classes"]] == [LEASE.iri]
+    assert client.app.state.search_responses.get("prefix", "lea") == prefix.content
+
+
+def test_query_variants_share_a_cache_entry():
+    graph = _SearchGraph()
+    client = _client(graph)
+    first = client.get("/search/label", params={"query": "Lease!"})
+    for variant in ("lease", " LEASE", "lease?"):
+        response = client.get("/search/label", params={"query": variant})
+        assert response.content == first.content
+    assert graph.calls == ["lease"]
+
+    client.get("/search/prefix", params={"query": "Lea"})
+    calls = list(graph.calls)
+    client.get("/search/prefix", params={"query": "LEA"})
+    assert graph.calls == calls
+
+
+def test_case_variants_fold_into_one_prefix_lookup():
+    graph = _SearchGraph()
+    classes, _ = _prefix_matches(graph, "lEA")
+    assert classes == [LEASE]
+    assert graph.calls == ["lEA"]
+
+
+def test_cache_hits_do_not_look_up_the_graph():
+    client = _client(_SearchGraph())
+    first = client.get("/search/definition", params={"query": "Lea"})
+    del client.app.state.folio
+    del client.app.state.class_json
+    assert client.get("/search/definition", params={"query": "Lea"}).content == (
+        first.content
+    )
+
+
+def test_out_of_range_queries_are_rejected_before_searching():
+    graph = _SearchGraph()
+    client = _client(graph)
+    for path in ("/search/prefix", "/search/label", "/search/llm/locations"):
+        assert client.get(path, params={"query": "L"}).status_code == 422
+        assert client.get(path, params={"query": "L" * 1025}).status_code == 422
+        assert client.get(path).status_code == 422
+    assert graph.calls == []
+
+
+def test_search_responses_revalidate_with_the_build_etag():
+    graph = _SearchGraph()
+    client = _client(graph)
+    response = client.get("/search/prefix", params={"query": "Lea"})
+    assert response.headers["etag"] == 'W/"build"'
+    assert "max-age=600" in response.headers["cache-control"]
+    calls = list(graph.calls)
+
+    revalidated = client.get(
+        "/search/label", params={"query": "Lea"}, headers={"If-None-Match": '"build"'}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert graph.calls == calls
+
+
+class _LLMGraph:
+    def __init__(self):
+        self.search_sets = []
+        self.walks = 0
+
+    def get_locations(self, max_depth):
+        self.walks += 1
+        return [LEASE] * max_depth
+
+    async def search_by_llm(self, query, search_set):
+        self.search_sets.append(search_set)
+        return [(owl_class, 7) for owl_class in search_set[:1]]
+
+
+def test_llm_search_sets_are_built_once_per_depth():
+    graph = _LLMGraph()
+    client = _client(graph)
+    params = {"query": "Paris", "max_depth": 2}
+    response = client.get("/search/llm/locations", params=params)
+    assert response.status_code == 200
+    assert response.json()["scores"] == [7.0]
+    assert graph.search_sets == [[LEASE, LEASE]]
+
+    client.get("/search/llm/locations", params={"query": "Lyon", "max_depth": 2})
+    assert graph.walks == 1
+    assert graph.search_sets[1] is graph.search_sets[0]
+
+
+def test_llm_results_are_cached_per_query_and_depth():
+    graph = _LLMGraph()
+    client = _client(graph)
+    params = {"query": "Paris", "max_depth": 2}
+    first = client.get("/search/llm/locations", params=params)
+    assert client.get("/search/llm/locations", params=params).content == first.content
+    assert len(graph.search_sets) == 1
+
+    client.get("/search/llm/locations", params={"query": "Paris", "max_depth": 1})
+    assert len(graph.search_sets) == 2
+
+
+class _AllSetsGraph:
+    def __init__(self):
+        self.walked = []
+
+    def __getattr__(self, getter):
+        def walk(max_depth):
+            self.walked.append(getter)
+            return [LEASE] * max_depth
+
+        return walk
+
+
+def test_warm_search_sets_builds_every_llm_set():
+    graph = _AllSetsGraph()
+    warm_search_sets(graph, depths=(1, 2))
+    assert len(graph.walked) == 38
+    assert "get_areas_of_law" in graph.walked
+
+    assert _memoized_search_set(graph, "get_locations", 2) == [LEASE, LEASE]
+    assert len(graph.walked) == 38
+
+
+def test_search_sets_survive_text_search_eviction(monkeypatch):
+    monkeypatch.setattr("folio_api.routes.search._SEARCH_CACHE_SIZE", 1)
+    graph = _AllSetsGraph()
+    warm_search_sets(graph, depths=(1,))
+    _memoized_search(graph, "search_by_label", 1)
+    _memoized_search(graph, "search_by_lessor", 1)
+    walked = len(graph.walked)
+
+    assert _memoized_search_set(graph, "get_locations", 1) == [LEASE]
+    assert len(graph.walked) == walked
+
+
+def test_label_index_casefolds_once():
+    graph = _SearchGraph()
+    index = _label_index(graph)
+    assert index.classes == [LEASE]
+    assert index.class_names.text == "lease"
+    assert index.class_positions == {LEASE.iri: 0}
+    assert _label_index(graph) is index
+
+
+def test_warm_search_indexes_builds_both_indexes():
+    graph = _SearchGraph()
+    graph.classes = [OWLClass(iri=LEASE.iri, label="Lease", definition="A lease.")]
+    warm_search_indexes(graph)
+    assert graph in _label_indexes
+    assert _definition_indexes[graph].texts == ["a lease"]
+
+
+def test_substring_matches_compare_casefolded_names():
+    strasse = OWLClass(
+        iri="https://folio.openlegalstandard.org/RStrasse",
+        label="Hauptstraße",
+        alternative_labels=["Main Street"],
+    )
+    graph = _SearchGraph()
+    graph.classes = [strasse]
+    for query in ("STRASSE", "ptstraß", "main st"):
+        assert _prefix_matches(graph, query)[0] == [strasse]
+    assert _prefix_matches(graph, "e\x00m")[0] == []
+
+
+def test_packed_names_scan_finds_each_entity_once():
+    graph = _SearchGraph()
+    graph.classes = [
+        OWLClass(iri=f"https://folio.openlegalstandard.org/R{label}", label=label)
+        for label in ("Lease", "Rent", "Sublease Lease", "Tenant")
+    ]
+    packed = _label_index(graph).class_names
+    assert list(_packed_matches(packed, "lease")) == [0, 2]
+    # the separator keeps "rent" + "sublease" from matching across names
+    assert list(_packed_matches(packed, "ntsub")) == []
+    # longer than every name, so the text is never scanned
+    assert packed.longest == len("sublease lease")
+    assert list(_packed_matches(packed, "sublease leases")) == []
+
+    classes, _ = _prefix_matches(graph, "ASE")
+    assert [c.label for c in classes] == ["Lease", "Sublease Lease"]
+
+
+class _DefinitionGraph:
+    classes = [
+        OWLClass(iri=f"https://folio.openlegalstandard.org/R{i}", definition=text)
+        for i, text in enumerate(
+            [
+                "A contract by which one party conveys land to another for rent.",
+                "An agreement between a landlord and a tenant.",
+                None,
+                "Land, and anything permanently attached to it!",
+                "A lease of property by a tenant to a subtenant.",
+            ]
+        )
+    ]
+    _basic_search = staticmethod(FOLIO._basic_search)
+
+
+def test_definition_search_matches_folio():
+    graph = _DefinitionGraph()
+    for query in ("tenant", "LAND", "contract for rent", "zzz"):
+        for limit in (2, 10):
+            assert _search_by_definition(graph, query, limit) == (
+                FOLIO.search_by_definition(graph, query, limit)
+            )
@@ -6,6 +6,14 @@ These tests must pass before any other tests are added — they verify
 the conftest.py fixtures actually do what the docstring claims.
 """
 
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+import folio_api.api
+from folio_api.api import get_app
+
 
 def test_app_boots(client):
     """The FastAPI app responds to /openapi.json after the lifespan runs."""
@@ -35,3 +43,19 @@ def test_property_children_built(property_children):
         "property_children reverse index is empty — "
         "api.py lifespan did not build it"
     )
+
+
+def test_failed_startup_detaches_log_handlers(monkeypatch, tmp_path):
+    """A lifespan that fails to load the ontology still removes its handler."""
+
+    def fail(*args):
+        raise RuntimeError("ontology unavailable")
+
+    monkeypatch.chdir(tmp_path)  # the fallback file handler writes api.log
+    monkeypatch.setattr(folio_api.api, "initialize_folio", fail)
+    logger = logging.getLogger("folio_api")
+    before = list(logger.handlers)
+    with pytest.raises(RuntimeError):
+        with TestClient(get_app()):
+            pass
+    assert logger.handlers == before
@@ -0,0 +1,67 @@
+"""Tests for the pure-ASGI fast path (folio_api/asgi_health.py).
+
+Self-contained: wraps a bare Starlette app whose routes fail loudly, so any
+request that reaches the router shows up in the response.
+"""
+
+import asyncio
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from folio_api.asgi_health import ROOT_REDIRECT, FastPathInterceptor
+from folio_api.routes.root import root_redirect
+
+HEALTH_BYTES = b'{"status":"healthy","folio_graph":null}'
+
+
+async def _routed(request):
+    return PlainTextResponse("routed")
+
+
+def _client(health_bytes=HEALTH_BYTES):
+    app = Starlette(
+        routes=[
+            Route("/", _routed),
+            Route("/info/health", _routed, methods=["GET", "POST"]),
+            Route("/other", _routed),
+        ],
+        middleware=[Middleware(FastPathInterceptor)],
+    )
+    if health_bytes is not None:
+        app.state.health_bytes = health_bytes
+    return TestClient(app)
+
+
+def test_health_is_answered_before_routing():
+    response = _client().get("/info/health")
+    assert response.status_code == 200
+    assert response.content == HEALTH_BYTES
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_root_redirects_to_explorer():
+    response = _client().get("/", follow_redirects=False)
+    assert response.status_code == 302
+    assert response.headers["location"] == "/explore/tree"
+
+
+def test_everything_else_passes_through():
+    client = _client()
+    assert client.get("/other").text == "routed"
+    assert client.post("/info/health").text == "routed"
+
+
+def test_health_before_startup_passes_through():
+    assert _client(health_bytes=None).get("/info/health").text == "routed"
+
+
+def test_routed_root_redirect_shares_the_response():
+    # requests that bypass the interceptor (e.g. HEAD) get the same object
+    response = asyncio.run(root_redirect())
+    assert response is ROOT_REDIRECT
+    assert response.status_code == 302
+    assert response.headers["location"] == "/explore/tree"
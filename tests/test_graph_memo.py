@@ -0,0 +1,43 @@
+"""Tests for the per-graph memo helpers (folio_api/graph_memo.py).
+
+Self-contained: plain objects stand in for FOLIO graphs, so no ontology load
+is needed.
+"""
+
+import weakref
+
+from folio_api.graph_memo import graph_cache, memoized, store_bounded
+
+
+class _Graph:
+    pass
+
+
+def test_values_are_computed_once_per_graph():
+    memo = weakref.WeakKeyDictionary()
+    graph, other = _Graph(), _Graph()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return ["lease"]
+
+    first = memoized(memo, 8, graph, "lease", compute)
+    assert memoized(memo, 8, graph, "lease", compute) is first
+    memoized(memo, 8, other, "lease", compute)
+    assert len(calls) == 2
+
+
+def test_oldest_entry_is_evicted():
+    cache = graph_cache(weakref.WeakKeyDictionary(), _Graph())
+    for key in "abc":
+        store_bounded(cache, key, key.upper(), max_size=2)
+    assert cache == {"b": "B", "c": "C"}
+
+
+def test_memo_is_dropped_with_its_graph():
+    memo = weakref.WeakKeyDictionary()
+    graph = _Graph()
+    memoized(memo, 8, graph, "lease", lambda: "Lease")
+    del graph
+    assert len(memo) == 0
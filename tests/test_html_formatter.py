@@ -0,0 +1,131 @@
+"""Tests for the class-page helpers in folio_api/rendering/html_formatter.py.
+
+Self-contained: a tiny dict-backed stand-in plays the role of the ``FOLIO``
+graph (``graph[iri]`` returns the class or ``None``), so no ontology load is
+needed.
+"""
+
+from folio import OWLClass
+
+from folio_api.rendering import (
+    clear_render_caches,
+    format_description,
+    get_node_neighbors,
+    render_tailwind_html,
+)
+
+OWL_THING = "http://www.w3.org/2002/07/owl#Thing"
+
+CONTRACT = OWLClass(
+    iri="https://folio.openlegalstandard.org/RContract",
+    label="Contract",
+    definition="A legally binding agreement.",
+)
+LEASE = OWLClass(
+    iri="https://folio.openlegalstandard.org/RLease",
+    label="Lease",
+    definition="A contract conveying the right to use property.",
+    sub_class_of=[CONTRACT.iri, OWL_THING],
+    parent_class_of=["https://folio.openlegalstandard.org/RSublease"],
+    see_also=[CONTRACT.iri, "https://example.com/lease", "plain text note"],
+    is_defined_by=CONTRACT.iri,
+)
+SUBLEASE = OWLClass(
+    iri="https://folio.openlegalstandard.org/RSublease",
+    label="",
+    sub_class_of=[LEASE.iri],
+)
+THING = OWLClass(iri=OWL_THING, label="Thing")
+
+
+class _FakeGraph:
+    def __init__(self, *classes):
+        self._classes = {owl_class.iri: owl_class for owl_class in classes}
+        self.lookups = 0
+
+    def __getitem__(self, iri):
+        self.lookups += 1
+        return self._classes.get(iri)
+
+
+def _graph():
+    return _FakeGraph(CONTRACT, LEASE, SUBLEASE, THING)
+
+
+def test_neighbors_cover_every_relationship():
+    nodes, edges = get_node_neighbors(LEASE, _graph())
+    relationships = {node["id"]: node["relationship"] for node in nodes}
+
+    assert relationships[LEASE.iri] == "self"
+    assert relationships[OWL_THING] == "sub_class_of"
+    assert relationships[SUBLEASE.iri] == "parent_class_of"
+    assert relationships["https://example.com/lease"] == "see_also"
+    # the last relationship recorded for a node wins
+    assert relationships[CONTRACT.iri] == "is_defined_by"
+    assert {edge["type"] for edge in edges} == {
+        "sub_class_of",
+        "parent_class_of",
+        "see_also",
+        "is_defined_by",
+    }
+    assert "plain text note" not in relationships
+    # only the self node and external links carry an explicit color
+    assert [node["id"] for node in nodes if "color" in node] == [
+        LEASE.iri,
+        "https://example.com/lease",
+    ]
+
+
+def test_unlabeled_neighbors_fall_back_to_iri():
+    nodes, _ = get_node_neighbors(LEASE, _graph())
+    labels = {node["id"]: node["label"] for node in nodes}
+
+    # no "#" fragment: the whole IRI is used
+    assert labels[SUBLEASE.iri] == SUBLEASE.iri
+    assert labels["https://example.com/lease"] == "lease"
+
+
+def test_neighbors_are_memoized_per_graph():
+    graph = _graph()
+    first = get_node_neighbors(LEASE, graph)
+    lookups = graph.lookups
+    assert get_node_neighbors(LEASE, graph) is first
+    assert graph.lookups == lookups
+
+    # a different (e.g. reloaded) graph is walked afresh
+    other = _graph()
+    assert get_node_neighbors(LEASE, other) is not first
+    assert other.lookups > 0
+
+
+def test_description_memo_is_tied_to_the_class_object():
+    assert format_description(CONTRACT) == "Contract - A legally binding agreement."
+    # same IRI, different object (e.g. after a graph reload): not served stale
+    reloaded = OWLClass(iri=CONTRACT.iri, label="Contract", definition="Revised.")
+    assert format_description(reloaded) == "Contract - Revised."
+
+
+def test_rendered_page_is_cached_per_branch():
+    graph = _graph()
+    config = {"folio": {"branch": "2.0.0", "repository": "alea-institute/folio"}}
+    page = render_tailwind_html(LEASE, graph, config)
+    assert "<title>Lease - FOLIO Ontology</title>" in page
+    assert render_tailwind_html(LEASE, graph, config) is page
+
+    other_branch = {"folio": {"branch": "main", "repository": "alea-institute/folio"}}
+    assert ">main</span>" in render_tailwind_html(LEASE, graph, other_branch)
+
+    clear_render_caches()
+    assert render_tailwind_html(LEASE, graph, config) is not page
+
+
+def test_page_escapes_class_text():
+    risky = OWLClass(
+        iri="https://folio.openlegalstandard.org/RRisky",
+        label="<b>Bold</b>",
+        definition="</script><script>alert(1)</script>",
+    )
+    page = render_tailwind_html(risky, _FakeGraph(risky))
+    assert "<b>Bold</b>" not in page
+    assert "&lt;b&gt;Bold&lt;/b&gt;" in page
+    assert "</script><script>alert(1)" not in page
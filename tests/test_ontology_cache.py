@@ -0,0 +1,94 @@
+"""Tests for the shared ontology snapshot (folio_api/ontology_cache.py).
+
+Self-contained: a tiny stand-in class plays the role of ``FOLIO`` and each test
+writes its snapshot under ``tmp_path``, so nothing depends on the ontology
+download.
+"""
+
+import os
+import stat
+
+from folio_api.ontology_cache import default_snapshot_dir, load_or_build
+
+
+class _FakeGraph:
+    """Picklable stand-in with one transient (unpicklable) attribute."""
+
+    def __init__(self):
+        self.classes = ["Contract", "Lease"]
+        self.llm = lambda: None  # lambdas cannot be pickled
+
+
+def _counting_builder():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return _FakeGraph()
+
+    return build, calls
+
+
+def test_first_call_builds_and_second_loads_snapshot(tmp_path):
+    build, calls = _counting_builder()
+    first = load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    second = load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+
+    assert len(calls) == 1
+    assert isinstance(second, _FakeGraph)
+    assert second.classes == first.classes
+
+
+def test_transient_attrs_are_dropped_from_snapshot(tmp_path):
+    build, _ = _counting_builder()
+    load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    restored = load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    assert restored.llm is None
+
+
+def test_changed_key_rebuilds(tmp_path):
+    build, calls = _counting_builder()
+    load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    load_or_build(build, {"branch": "main"}, snapshot_dir=tmp_path)
+    assert len(calls) == 2
+
+
+def test_corrupt_snapshot_falls_back_to_build(tmp_path):
+    build, calls = _counting_builder()
+    load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    for snapshot in tmp_path.glob("folio_graph_*.pkl"):
+        snapshot.write_bytes(b"not a pickle")
+    restored = load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    assert len(calls) == 2
+    assert restored.classes == ["Contract", "Lease"]
+
+
+def test_group_or_world_writable_snapshot_is_refused(tmp_path):
+    build, calls = _counting_builder()
+    load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    for snapshot in tmp_path.glob("folio_graph_*.pkl"):
+        snapshot.chmod(0o666)
+    load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    assert len(calls) == 2
+
+
+def test_snapshot_owned_by_another_user_is_refused(tmp_path, monkeypatch):
+    build, calls = _counting_builder()
+    load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    load_or_build(build, {"branch": "2.0.0"}, snapshot_dir=tmp_path)
+    assert len(calls) == 2
+
+
+def test_default_snapshot_dir_is_owner_only(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    directory = default_snapshot_dir()
+    assert directory == tmp_path / f"folio-api-{os.getuid()}"
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+    # a directory someone else owns is not used
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    (tmp_path / f"folio-api-{uid + 1}").mkdir(mode=0o700)
+    assert default_snapshot_dir() is None
@@ -0,0 +1,34 @@
+"""The OpenAPI schema is served from pre-encoded bytes.
+
+Uses ``get_app()`` without entering the lifespan, so no ontology load is
+needed: the route falls back to encoding the schema on first request.
+"""
+
+from fastapi.testclient import TestClient
+
+from folio_api.api import get_app
+
+
+def test_openapi_json_matches_app_schema():
+    app = get_app()
+    response = TestClient(app).get("/openapi.json")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == app.openapi()
+    # encoded once, then reused
+    assert app.state.openapi_bytes == response.content
+
+
+def test_docs_still_point_at_openapi_json():
+    response = TestClient(get_app()).get("/docs")
+    assert response.status_code == 200
+    assert "/openapi.json" in response.text
+
+
+def test_root_path_is_listed_in_servers():
+    app = get_app()
+    response = TestClient(app, root_path="/api").get("/openapi.json")
+    assert response.status_code == 200
+    assert response.json()["servers"] == [{"url": "/api"}]
+    # the unprefixed body is left without servers
+    assert "servers" not in TestClient(app).get("/openapi.json").json()
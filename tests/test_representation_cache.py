@@ -0,0 +1,100 @@
+"""Tests for the rendered-representation LRU (folio_api/representation_cache.py).
+
+Self-contained: renders are plain callables, so no ontology load is needed.
+"""
+
+import gzip
+
+from folio_api.representation_cache import RepresentationCache
+
+IRI = "https://folio.openlegalstandard.org/R8pNPutX0TN6DlEqkyZuxSw"
+
+
+def test_miss_renders_once_and_encodes():
+    cache = RepresentationCache()
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "# Lessor"
+
+    assert cache.get_or_render("markdown", IRI, render) == b"# Lessor"
+    assert cache.get_or_render("markdown", IRI, render) == b"# Lessor"
+    assert len(calls) == 1
+
+
+def test_formats_are_cached_separately():
+    cache = RepresentationCache()
+    cache.get_or_render("markdown", IRI, lambda: "# Lessor")
+    cache.get_or_render("jsonld", IRI, lambda: b"{}")
+    assert len(cache) == 2
+    assert cache.get("jsonld", IRI) == b"{}"
+    assert cache.get("xml", IRI) is None
+
+
+def test_least_recently_served_is_evicted():
+    cache = RepresentationCache(max_size=2)
+    cache.put("markdown", "a", b"a")
+    cache.put("markdown", "b", b"b")
+    cache.get("markdown", "a")
+    cache.put("markdown", "c", b"c")
+    assert cache.get("markdown", "b") is None
+    assert cache.get("markdown", "a") == b"a"
+    assert cache.get("markdown", "c") == b"c"
+
+
+def test_gzipped_copy_is_compressed_once():
+    cache = RepresentationCache()
+    assert cache.gzipped("html", IRI) is None
+
+    body = cache.get_or_render("html", IRI, lambda: "<p>Lessor</p>" * 100)
+    compressed = cache.gzipped("html", IRI)
+    assert gzip.decompress(compressed) == body
+    assert cache.gzipped("html", IRI) is compressed
+
+
+def test_clear():
+    cache = RepresentationCache()
+    cache.put("html", IRI, b"<html></html>")
+    cache.clear()
+    assert len(cache) == 0
+
+
+class _Entity:
+    def __init__(self, iri):
+        self.iri = iri
+
+
+def test_warm_renders_everything_without_eating_the_budget():
+    cache = RepresentationCache(max_size=1)
+    cache.warm("markdown", [_Entity("a"), _Entity("b")], lambda e: f"# {e.iri}")
+    assert cache.get("markdown", "a") == b"# a"
+    assert cache.get("markdown", "b") == b"# b"
+
+    # lazily rendered entries still get the configured budget on top
+    cache.get_or_render("html", "a", lambda: "<html></html>")
+    assert len(cache) == 3
+
+
+def test_preload_stores_rendered_pairs():
+    cache = RepresentationCache(max_size=1)
+    cache.preload("xml", [("a", "<a/>"), ("b", b"<b/>")])
+    assert cache.get("xml", "a") == b"<a/>"
+    assert cache.get("xml", "b") == b"<b/>"
+    assert cache.max_size == 3
+
+
+def test_byte_bound_evicts_and_skips_oversized_bodies():
+    cache = RepresentationCache(max_bytes=10)
+    cache.put("prefix", "a", b"aaaa")
+    cache.put("prefix", "b", b"bbbb")
+    cache.put("prefix", "c", b"cccc")
+    assert cache.get("prefix", "a") is None
+    assert cache.nbytes == 8
+
+    cache.put("prefix", "big", b"x" * 11)
+    assert cache.get("prefix", "big") is None
+    assert cache.nbytes == 8
+
+    cache.clear()
+    assert cache.nbytes == 0
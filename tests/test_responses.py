@@ -0,0 +1,32 @@
+"""Tests for the shared response classes (folio_api/responses.py)."""
+
+import json
+
+from folio import OWLObjectProperty
+
+from folio_api.models import OWLObjectPropertyList
+from folio_api.responses import PydanticORJSONResponse, etag_matches
+
+DRAFTED = OWLObjectProperty(
+    iri="https://folio.openlegalstandard.org/R6qohvM786wjw0MNQJg9Dq",
+    label="drafted",
+)
+
+
+def test_models_render_with_model_dump_json():
+    payload = OWLObjectPropertyList(properties=[DRAFTED])
+    response = PydanticORJSONResponse(payload)
+    assert response.body == payload.model_dump_json().encode("utf-8")
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_plain_content_renders_with_orjson():
+    response = PydanticORJSONResponse({1: "one"})
+    assert json.loads(response.body) == {"1": "one"}
+
+
+def test_etag_matches_uses_weak_comparison():
+    assert etag_matches('"a", W/"build"', 'W/"build"')
+    assert etag_matches("*", 'W/"build"')
+    assert not etag_matches('"stale"', 'W/"build"')
+    assert not etag_matches(None, 'W/"build"')
@@ -0,0 +1,121 @@
+"""Tests for the pre-serialized entity JSON cache (folio_api/serialization.py).
+
+Self-contained: builds a few OWLClass/OWLObjectProperty objects by hand and
+checks that bodies assembled from cached fragments are identical to what the
+pydantic response models would produce, so no ontology load is needed.
+"""
+
+import json
+
+from folio import OWLClass, OWLObjectProperty
+
+from folio_api.models import OWLClassList, OWLObjectPropertyList, OWLSearchResults
+from folio_api.serialization import ClassJSONCache
+
+LESSOR = OWLClass(
+    iri="https://folio.openlegalstandard.org/R8pNPutX0TN6DlEqkyZuxSw",
+    label="Lessor",
+    definition="A party that grants a right to use something in return for payment.",
+)
+LESSEE = OWLClass(
+    iri="https://folio.openlegalstandard.org/R7jHq0yJ5p0Gd1hE9NfSxTW",
+    label="Lessee",
+    alternative_labels=["Tenant"],
+)
+DRAFTED = OWLObjectProperty(
+    iri="https://folio.openlegalstandard.org/R6qohvM786wjw0MNQJg9Dq",
+    label="drafted",
+)
+
+
+def test_class_list_matches_model():
+    cache = ClassJSONCache()
+    cache.warm([LESSOR, LESSEE, DRAFTED])
+    body = cache.class_list([LESSOR, LESSEE], [DRAFTED])
+    expected = OWLClassList(classes=[LESSOR, LESSEE], properties=[DRAFTED])
+    assert json.loads(body) == json.loads(expected.model_dump_json())
+
+
+def test_empty_class_list():
+    assert json.loads(ClassJSONCache().class_list([])) == {
+        "classes": [],
+        "properties": [],
+    }
+
+
+def test_empty_bodies_are_shared():
+    cache = ClassJSONCache()
+    assert cache.class_list(iter(()), []) is cache.class_list([])
+    assert cache.search_results([]) is cache.search_results(iter(()))
+    assert json.loads(cache.search_results([])) == json.loads(
+        OWLSearchResults.from_hits([]).model_dump_json()
+    )
+
+
+def test_search_results_match_model():
+    cache = ClassJSONCache()
+    hits = [(LESSOR, 0.95), (LESSEE, 1)]
+    body = cache.search_results(hits)
+    expected = OWLSearchResults.from_hits(hits)
+    assert json.loads(body) == json.loads(expected.model_dump_json())
+    assert json.loads(body)["scores"] == [0.95, 1.0]
+
+
+def test_miss_is_serialized_and_cached():
+    cache = ClassJSONCache()
+    assert len(cache) == 0
+    first = cache.fragment(LESSOR)
+    assert len(cache) == 1
+    assert cache.fragment(LESSOR) is first
+
+
+def test_streamed_class_list_matches_buffered():
+    cache = ClassJSONCache()
+    classes = [LESSOR, LESSEE] * 50
+    chunks = list(cache.iter_class_list(classes, [DRAFTED], chunk_size=256))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == cache.class_list(classes, [DRAFTED])
+
+
+def test_streamed_empty_class_list():
+    cache = ClassJSONCache()
+    assert b"".join(cache.iter_class_list([])) == cache.class_list([])
+
+
+def test_exclude_none_drops_null_fields():
+    cache = ClassJSONCache(exclude_none=True)
+    body = json.loads(cache.fragment(LESSEE))
+    assert body == json.loads(LESSEE.model_dump_json(exclude_none=True))
+    assert None not in body.values()
+    assert len(cache.fragment(LESSEE)) < len(ClassJSONCache().fragment(LESSEE))
+    # still a valid OWLClass payload
+    assert OWLClass.model_validate(body) == LESSEE
+
+
+def test_mapping_keys_fragments_by_requested_iri():
+    cache = ClassJSONCache()
+    body = cache.mapping([("R8pNPutX0TN6DlEqkyZuxSw", LESSOR), (DRAFTED.iri, DRAFTED)])
+    assert json.loads(body) == {
+        "R8pNPutX0TN6DlEqkyZuxSw": json.loads(LESSOR.model_dump_json()),
+        DRAFTED.iri: json.loads(DRAFTED.model_dump_json()),
+    }
+    assert json.loads(cache.mapping([])) == {}
+
+
+def test_property_list_matches_model():
+    cache = ClassJSONCache()
+    body = cache.property_list([DRAFTED])
+    expected = OWLObjectPropertyList(properties=[DRAFTED])
+    assert json.loads(body) == json.loads(expected.model_dump_json())
+
+
+def test_content_digest_tracks_fragment_content():
+    cache = ClassJSONCache()
+    cache.warm([LESSOR, LESSEE])
+    same = ClassJSONCache()
+    same.warm([LESSOR, LESSEE])
+    assert cache.content_digest() == same.content_digest()
+
+    edited = ClassJSONCache()
+    edited.warm([LESSOR.model_copy(update={"label": "Landlord"}), LESSEE])
+    assert edited.content_digest() != cache.content_digest()
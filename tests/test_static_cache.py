@@ -38,3 +38,55 @@ def test_version_stamped_url_still_serves(client):
     """The ``?v=`` query does not break static file resolution."""
     response = client.get("/static/js/unified_tree.js?v=1234567890")
     assert response.status_code == 200
+
+
+def _static_client(tmp_path):
+    """A bare Starlette app serving ``tmp_path`` through ``CachedStaticFiles``
+    (no ontology needed)."""
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+    from starlette.testclient import TestClient
+
+    from folio_api.api import CachedStaticFiles
+
+    (tmp_path / "app.js").write_text("console.log('folio');\n")
+    app = Starlette(
+        routes=[Mount("/static", CachedStaticFiles(directory=tmp_path), name="static")]
+    )
+    return TestClient(app)
+
+
+def test_static_etag_is_mtime_size(tmp_path):
+    """The ETag is derived from the file's mtime and size."""
+    client = _static_client(tmp_path)
+    stat = (tmp_path / "app.js").stat()
+    response = client.get("/static/app.js")
+    assert response.status_code == 200
+    assert response.headers["etag"] == f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    assert "last-modified" in response.headers
+
+
+def test_static_revalidation_returns_304(tmp_path):
+    """A matching ``If-None-Match`` gets an empty 304 that keeps Cache-Control."""
+    client = _static_client(tmp_path)
+    etag = client.get("/static/app.js").headers["etag"]
+    response = client.get("/static/app.js", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert "must-revalidate" in response.headers.get("cache-control", "")
+
+
+def test_render_version_tracks_template_edits(tmp_path):
+    """Editing a template changes the digest that keys the entity ETag."""
+    from folio_api.api import _compute_render_version
+
+    package = tmp_path / "pkg"
+    templates = package / "templates"
+    templates.mkdir(parents=True)
+    (package / "render.py").write_text("def render(): ...\n")
+    page = templates / "page.html"
+    page.write_text("<p>{{ label }}</p>")
+    before = _compute_render_version.__wrapped__(templates, package)
+
+    page.write_text("<p>{{ label }}!</p>")
+    assert _compute_render_version.__wrapped__(templates, package) != before